@@ -1,3 +1,4 @@
+import contextlib
 import copy
 import traceback
 import time
@@ -18,6 +19,28 @@ from omtk.libs import libHistory
 log = logging.getLogger('omtk')
 
 
+_PYNODE_TYPES = (pymel.PyNode, pymel.Attribute)
+
+
+def _can_delete(val):
+    """
+    :return: True if the value is a reference to a PyNode or Attribute that don't exist anymore.
+    """
+    return isinstance(val, _PYNODE_TYPES) and not libPymel.is_valid_PyNode(val)
+
+
+def _connect_uniform_scale(src, dst, force=False):
+    """
+    Drive the scaleX, scaleY and scaleZ attributes of a node using a single attribute.
+    Note: We use cmds since pymel would wrap every attributes.
+    :param src: The name of the source attribute. ex: 'anm_root.globalScale'
+    :param dst: The name of the destination node.
+    :param force: If True, any existing connection will be replaced.
+    """
+    for attr_name in ('scaleX', 'scaleY', 'scaleZ'):
+        cmds.connectAttr(src, '{0}.{1}'.format(dst, attr_name), force=force)
+
+
 class CtrlRoot(BaseCtrl):
     """
     The main ctrl. Support global uniform scaling only.
@@ -31,23 +54,22 @@ class CtrlRoot(BaseCtrl):
         Create a wide circle.
         """
         # use meshes boundinx box
-        node = pymel.circle(*args, **kwargs)[0]
-        make = node.getShape().create.inputs()[0]
-        make.radius.set(size)
-        make.normal.set((0, 1, 0))
+        # Note: We use cmds since pymel would wrap every intermediate nodes and attributes.
+        transform, make = cmds.circle(*args, **kwargs)
+        cmds.setAttr(make + '.radius', size)
+        cmds.setAttr(make + '.normal', 0, 1, 0, type='double3')
 
-        return node
+        return pymel.PyNode(transform)
 
     def build(self, create_global_scale_attr=True, *args, **kwargs):
         super(CtrlRoot, self).build(*args, **kwargs)
 
         # Add a globalScale attribute to replace the sx, sy and sz.
         if create_global_scale_attr and not self.node.hasAttr('globalScale'):
-            pymel.addAttr(self.node, longName='globalScale', k=True, defaultValue=1.0, minValue=0.001)
-            pymel.connectAttr(self.node.globalScale, self.node.sx)
-            pymel.connectAttr(self.node.globalScale, self.node.sy)
-            pymel.connectAttr(self.node.globalScale, self.node.sz)
-            self.node.s.set(lock=True, channelBox=False)
+            node = self.node.__melobject__()
+            cmds.addAttr(node, longName='globalScale', k=True, defaultValue=1.0, minValue=0.001)
+            _connect_uniform_scale(node + '.globalScale', node)
+            cmds.setAttr(node + '.s', lock=True, channelBox=False)
 
     @classmethod
     def _get_recommended_radius(cls, rig, min_size=1.0):
@@ -129,6 +151,22 @@ class Rig(object):
     LEGACY_ARM_IK_CTRL_ORIENTATION = False
     LEGACY_LEG_IK_CTRL_ORIENTATION = False
 
+    # Attributes that can reference a PyNode that was deleted during un-building (see _clean_invalid_pynodes).
+    # Sub-classes that define their own groups should extend it.
+    _PYNODE_ATTRS = (
+        'grp_anm',
+        'grp_geo',
+        'grp_jnt',
+        'grp_rig',
+        'grp_master',
+        'grp_backup',
+        'layer_anm',
+        'layer_geo',
+        'layer_rig',
+        'layer_jnt',
+        'modules',
+    )
+
     def __init__(self, name=None):
         self.name = name if name else self.DEFAULT_NAME
         self.modules = []
@@ -143,6 +181,7 @@ class Rig(object):
         self.layer_rig = None
         self.layer_jnt = None
         self._color_ctrl = False  # Bool to know if we want to colorize the ctrl
+        self._nomenclature_cache = None  # Cached return value of _get_nomenclature_cls
 
     #
     # Logging implementation
@@ -178,8 +217,11 @@ class Rig(object):
     def nomenclature(self):
         """
         Singleton that will return the nomenclature to use.
+        The value is cached since it is accessed a lot when building.
         """
-        return self._get_nomenclature_cls()
+        if self._nomenclature_cache is None:
+            self._nomenclature_cache = self._get_nomenclature_cls()
+        return self._nomenclature_cache
 
     #
     # collections.MutableSequence implementation
@@ -227,12 +269,14 @@ class Rig(object):
         """
         Cleaning routine automatically called by libSerialization after a network import.
         """
+        # Invalidate the nomenclature cache.
+        self._nomenclature_cache = None
 
         # Ensure there's no None value in the .children array.
-        try:
-            self.modules = filter(None, self.modules)
-        except (AttributeError, TypeError):
-            pass
+        # The list is compacted in place to preserve any reference to it.
+        modules = getattr(self, 'modules', None)
+        if isinstance(modules, list):
+            modules[:] = [module for module in modules if module]
 
     #
     # Main implementation
@@ -325,16 +369,20 @@ class Rig(object):
         return False
 
     def _clean_invalid_pynodes(self):
-        fnCanDelete = lambda x: (isinstance(x, (pymel.PyNode, pymel.Attribute)) and not libPymel.is_valid_PyNode(x))
-        for key, val in self.__dict__.iteritems():
-            if fnCanDelete(val):
+        for key in self._PYNODE_ATTRS:
+            val = getattr(self, key, None)
+            if _can_delete(val):
                 setattr(self, key, None)
             elif isinstance(val, (list, set, tuple)):
-                for i in reversed(range(len(val))):
-                    if fnCanDelete(val[i]):
-                        val.pop(i)
-                if len(val) == 0:
+                # Rebuild the collection in a single pass instead of popping each invalid item.
+                filtered = [item for item in val if not _can_delete(item)]
+                if not filtered:
                     setattr(self, key, None)
+                elif len(filtered) != len(val):
+                    if isinstance(val, list):
+                        val[:] = filtered
+                    else:
+                        setattr(self, key, type(val)(filtered))
 
     def validate(self):
         """
@@ -518,6 +566,7 @@ class Rig(object):
             del self._cache
         except AttributeError:
             pass
+        self._nomenclature_cache = None
         for module in self.modules:
             # todo: implement _clear_cache on modules?
             if module:
@@ -533,40 +582,43 @@ class Rig(object):
         # This ensure we always have fresh data.
         self._clear_cache()
 
+        nomenclature = self.nomenclature
+
         # Look for a root joint
         if create_grp_jnt:
             # For now, we will determine the root jnt by it's name used in each rig. Not the best solution,
             # but currently the safer since we want to support multiple deformation layer
             if not libPymel.is_valid_PyNode(self.grp_jnt):
                 # self.grp_jnt = next(iter(libPymel.ls_root(type='joint')), None)
-                if cmds.objExists(self.nomenclature.root_jnt_name):
-                    self.grp_jnt = pymel.PyNode(self.nomenclature.root_jnt_name)
+                if cmds.objExists(nomenclature.root_jnt_name):
+                    self.grp_jnt = pymel.PyNode(nomenclature.root_jnt_name)
                 else:
                     self.warning("Could not find any root joint, master ctrl will not drive anything")
-                    # self.grp_jnt = pymel.createNode('joint', name=self.nomenclature.root_jnt_name)
+                    # self.grp_jnt = pymel.createNode('joint', name=nomenclature.root_jnt_name)
 
         # Create the master grp
         if create_master_grp:
-            self.grp_master = self.build_grp(RigGrp, self.grp_master, self.name + '_' + self.nomenclature.type_rig)
+            self.grp_master = self.build_grp(RigGrp, self.grp_master, self.name + '_' + nomenclature.type_rig)
 
         # Create grp_anm
         if create_grp_anm:
-            grp_anim_size = CtrlRoot._get_recommended_radius(self)
-            self.grp_anm = self.build_grp(CtrlRoot, self.grp_anm, self.nomenclature.root_anm_name, size=grp_anim_size)
+            # Only analyze the scene geometries if the root ctrl actually need to be built.
+            if isinstance(self.grp_anm, CtrlRoot) and self.grp_anm.is_built():
+                grp_anim_size = None
+            else:
+                grp_anim_size = CtrlRoot._get_recommended_radius(self)
+            self.grp_anm = self.build_grp(CtrlRoot, self.grp_anm, nomenclature.root_anm_name, size=grp_anim_size)
 
         # Create grp_rig
         if create_grp_rig:
-            self.grp_rig = self.build_grp(RigGrp, self.grp_rig, self.nomenclature.root_rig_name)
+            self.grp_rig = self.build_grp(RigGrp, self.grp_rig, nomenclature.root_rig_name)
 
         # Create grp_geo
         if create_grp_geo:
-            all_geos = libPymel.ls_root_geos()
-            self.grp_geo = self.build_grp(RigGrp, self.grp_geo, self.nomenclature.root_geo_name)
-            # if all_geos:
-            #    all_geos.setParent(self.grp_geo)
+            self.grp_geo = self.build_grp(RigGrp, self.grp_geo, nomenclature.root_geo_name)
 
         if create_grp_backup:
-            self.grp_backup = self.build_grp(RigGrp, self.grp_backup, self.nomenclature.root_backup_name)
+            self.grp_backup = self.build_grp(RigGrp, self.grp_backup, nomenclature.root_backup_name)
 
         # Parent all grp on the master grp
         if self.grp_master:
@@ -583,40 +635,42 @@ class Rig(object):
 
         # Setup displayLayers
         if create_display_layers:
-            if not pymel.objExists(self.nomenclature.layer_anm_name):
-                self.layer_anm = pymel.createDisplayLayer(name=self.nomenclature.layer_anm_name, number=1, empty=True)
+            if not pymel.objExists(nomenclature.layer_anm_name):
+                self.layer_anm = pymel.createDisplayLayer(name=nomenclature.layer_anm_name, number=1, empty=True)
                 self.layer_anm.color.set(17)  # Yellow
             else:
-                self.layer_anm = pymel.PyNode(self.nomenclature.layer_anm_name)
+                self.layer_anm = pymel.PyNode(nomenclature.layer_anm_name)
             pymel.editDisplayLayerMembers(self.layer_anm, self.grp_anm, noRecurse=True)
 
-            if not pymel.objExists(self.nomenclature.layer_rig_name):
-                self.layer_rig = pymel.createDisplayLayer(name=self.nomenclature.layer_rig_name, number=1, empty=True)
+            if not pymel.objExists(nomenclature.layer_rig_name):
+                self.layer_rig = pymel.createDisplayLayer(name=nomenclature.layer_rig_name, number=1, empty=True)
                 self.layer_rig.color.set(13)  # Red
                 # self.layer_rig.visibility.set(0)  # Hidden
                 self.layer_rig.displayType.set(2)  # Frozen
             else:
-                self.layer_rig = pymel.PyNode(self.nomenclature.layer_rig_name)
-            pymel.editDisplayLayerMembers(self.layer_rig, self.grp_rig, noRecurse=True)
-            pymel.editDisplayLayerMembers(self.layer_rig, self.grp_jnt, noRecurse=True)
-
-            if not pymel.objExists(self.nomenclature.layer_geo_name):
-                self.layer_geo = pymel.createDisplayLayer(name=self.nomenclature.layer_geo_name, number=1, empty=True)
+                self.layer_rig = pymel.PyNode(nomenclature.layer_rig_name)
+            # Add all the members in a single call.
+            layer_rig_members = [str(node) for node in (self.grp_rig, self.grp_jnt) if node]
+            if layer_rig_members:
+                cmds.editDisplayLayerMembers(str(self.layer_rig), layer_rig_members, noRecurse=True)
+
+            if not pymel.objExists(nomenclature.layer_geo_name):
+                self.layer_geo = pymel.createDisplayLayer(name=nomenclature.layer_geo_name, number=1, empty=True)
                 self.layer_geo.color.set(12)  # Green?
                 self.layer_geo.displayType.set(2)  # Frozen
             else:
-                self.layer_geo = pymel.PyNode(self.nomenclature.layer_geo_name)
+                self.layer_geo = pymel.PyNode(nomenclature.layer_geo_name)
             pymel.editDisplayLayerMembers(self.layer_geo, self.grp_geo, noRecurse=True)
 
             if create_layer_jnt:
-                if not pymel.objExists(self.nomenclature.layer_jnt_name):
-                    self.layer_jnt = pymel.createDisplayLayer(name=self.nomenclature.layer_jnt_name, number=1,
+                if not pymel.objExists(nomenclature.layer_jnt_name):
+                    self.layer_jnt = pymel.createDisplayLayer(name=nomenclature.layer_jnt_name, number=1,
                                                               empty=True)
                     self.layer_jnt.color.set(1)  # Black?
                     self.layer_jnt.visibility.set(0)  # Hidden
                     self.layer_jnt.displayType.set(2)  # Frozen
                 else:
-                    self.layer_jnt = pymel.PyNode(self.nomenclature.layer_geo_name)
+                    self.layer_jnt = pymel.PyNode(nomenclature.layer_geo_name)
                 pymel.editDisplayLayerMembers(self.layer_jnt, self.grp_jnt, noRecurse=True)
 
     def _sort_modules_by_dependencies(self, modules):
@@ -640,6 +694,41 @@ class Rig(object):
 
         return sorted_modules
 
+    @contextlib.contextmanager
+    def _build_context(self):
+        """
+        Context that batch all the scene modifications done while building or un-building the rig.
+        The evaluation manager and the viewport refresh are suspended and all the changes are
+        recorded in a single undo chunk. The previous state is always restored on exit.
+        """
+        is_batch = cmds.about(batch=True)
+        evaluation_mode = next(iter(cmds.evaluationManager(query=True, mode=True) or []), None)
+        ogs_paused = False
+        # The refresh might already be suspended by the caller (ex: a batch tool or an outer build).
+        refresh_suspended = is_batch or cmds.refresh(query=True, suspend=True)
+
+        if evaluation_mode and evaluation_mode != 'off':
+            cmds.evaluationManager(mode='off')
+        if not refresh_suspended:
+            cmds.refresh(suspend=True)
+        if not is_batch:
+            # Note that the ogs pause flag is a toggle.
+            if not cmds.ogs(query=True, pause=True):
+                cmds.ogs(pause=True)
+                ogs_paused = True
+        cmds.undoInfo(openChunk=True)
+
+        try:
+            yield
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            if ogs_paused:
+                cmds.ogs(pause=True)
+            if not refresh_suspended:
+                cmds.refresh(suspend=False)
+            if evaluation_mode and evaluation_mode != 'off':
+                cmds.evaluationManager(mode=evaluation_mode)
+
     def build(self, modules=None, skip_validation=False, strict=False, **kwargs):
         """
         Build the whole rig or part of the rig.
@@ -664,98 +753,104 @@ class Rig(object):
 
         self.info("Building")
 
-        sTime = time.time()
+        with self._build_context():
+            sTime = time.time()
 
-        #
-        # Prebuild
-        #
-        self.pre_build()
+            #
+            # Prebuild
+            #
+            # Display layers are only useful when there's a viewport to display them.
+            self.pre_build(create_display_layers=not cmds.about(batch=True))
 
-        #
-        # Resolve modules to build
-        #
+            #
+            # Resolve modules to build
+            #
 
-        # If no modules are provided, build everything.
-        if modules is None:
-            modules = self.modules
+            # If no modules are provided, build everything.
+            if modules is None:
+                modules = self.modules
 
-        # Filter any module that don't have an input.
-        modules = filter(lambda module: module.jnt, modules)
+            # Filter any module that don't have an input.
+            modules = filter(lambda module: module.jnt, modules)
 
-        # Sort modules by ascending hierarchical order.
-        # This ensure modules are built in the proper order.
-        # This should not be necessary, however it can happen (ex: dpSpine provided space switch target only available after building it).
-        modules = sorted(modules, key=(lambda x: libPymel.get_num_parents(x.chain_jnt.start)))
+            # Sort modules by ascending hierarchical order.
+            # This ensure modules are built in the proper order.
+            # This should not be necessary, however it can happen (ex: dpSpine provided space switch target only available after building it).
+            modules = sorted(modules, key=(lambda x: libPymel.get_num_parents(x.chain_jnt.start)))
 
-        # Add modules dependencies
-        for i in reversed(xrange(len(modules))):
-            module = modules[i]
-            dependencies = module.get_dependencies_modules()
-            if dependencies:
-                for dependency in dependencies:
-                    if not dependency in modules:
-                        modules.insert(i, dependency)
+            # Add modules dependencies
+            for i in reversed(xrange(len(modules))):
+                module = modules[i]
+                dependencies = module.get_dependencies_modules()
+                if dependencies:
+                    for dependency in dependencies:
+                        if not dependency in modules:
+                            modules.insert(i, dependency)
 
-        # Sort modules by their dependencies
-        modules = self._sort_modules_by_dependencies(modules)
+            # Sort modules by their dependencies
+            modules = self._sort_modules_by_dependencies(modules)
 
-        log.debug("Will build modules in the specified order: {0}".format(', '.join([str(m) for m in modules])))
+            log.debug("Will build modules in the specified order: {0}".format(', '.join([str(m) for m in modules])))
 
-        #
-        # Build modules
-        #
-        current_namespace = cmds.namespaceInfo(currentNamespace=True)
+            #
+            # Build modules
+            #
+            current_namespace = cmds.namespaceInfo(currentNamespace=True)
 
-        try:
-            for module in modules:
-                if module.is_built():
-                    continue
-
-                if not skip_validation:
-                    try:
-                        module.validate()
-                    except Exception, e:
-                        self.warning("Can't build {0}: {1}".format(module, e))
-                        if strict:
-                            traceback.print_exc()
-                            raise e
+            try:
+                for module in modules:
+                    if module.is_built():
                         continue
 
-                if not module.locked:
-                    try:
-                        # Switch namespace if needed
-                        module_namespace = module.get_inputs_namespace()
-                        module_namespace = module_namespace or ':'
-                        if module_namespace != current_namespace:
-                            cmds.namespace(setNamespace=':' + module_namespace)
-                            current_namespace = module_namespace
-
-                        module.build(**kwargs)
-                        self.post_build_module(module)
-                    except Exception, e:
-                        self.error(
-                            "Error building {0}. Received {1}. {2}".format(module, type(e).__name__, str(e).strip()))
-                        traceback.print_exc()
-                        if strict:
-                            raise e
-        finally:
-            # Ensure we always return to the default namespace.
-            cmds.namespace(setNamespace=':')
-
-        # Connect global scale to jnt root
-        if self.grp_anm:
-            if self.grp_jnt:
-                pymel.delete(
-                    [module for module in self.grp_jnt.getChildren() if isinstance(module, pymel.nodetypes.Constraint)])
-                pymel.parentConstraint(self.grp_anm, self.grp_jnt, maintainOffset=True)
-                pymel.connectAttr(self.grp_anm.globalScale, self.grp_jnt.scaleX, force=True)
-                pymel.connectAttr(self.grp_anm.globalScale, self.grp_jnt.scaleY, force=True)
-                pymel.connectAttr(self.grp_anm.globalScale, self.grp_jnt.scaleZ, force=True)
-
-        # Store the version of omtk used to build the rig.
-        self.version = api.get_version()
+                    if not skip_validation:
+                        try:
+                            module.validate()
+                        except Exception, e:
+                            self.warning("Can't build {0}: {1}".format(module, e))
+                            if strict:
+                                traceback.print_exc()
+                                raise e
+                            continue
+
+                    if not module.locked:
+                        try:
+                            # Switch namespace if needed
+                            module_namespace = module.get_inputs_namespace()
+                            module_namespace = module_namespace or ':'
+                            if module_namespace != current_namespace:
+                                cmds.namespace(setNamespace=':' + module_namespace)
+                                current_namespace = module_namespace
+
+                            module.build(**kwargs)
+                            self.post_build_module(module)
+                        except Exception, e:
+                            self.error(
+                                "Error building {0}. Received {1}. {2}".format(module, type(e).__name__, str(e).strip()))
+                            traceback.print_exc()
+                            if strict:
+                                raise e
+            finally:
+                # Ensure we always return to the default namespace.
+                cmds.namespace(setNamespace=':')
 
-        self.debug("[classRigRoot.Build] took {0} ms".format(time.time() - sTime))
+            # Connect global scale to jnt root
+            if self.grp_anm:
+                if self.grp_jnt:
+                    # Note: We use cmds since we only need the constraints and pymel would wrap every children.
+                    constraints = cmds.listRelatives(
+                        self.grp_jnt.__melobject__(), children=True, type='constraint', fullPath=True
+                    )
+                    if constraints:
+                        cmds.delete(constraints)
+                    pymel.parentConstraint(self.grp_anm, self.grp_jnt, maintainOffset=True)
+                    _connect_uniform_scale(
+                        self.grp_anm.__melobject__() + '.globalScale', self.grp_jnt.__melobject__(), force=True
+                    )
+
+            # Store the version of omtk used to build the rig.
+            self.version = api.get_version()
+
+            self.debug("[classRigRoot.Build] took {0} ms".format(time.time() - sTime))
 
         return True
 
@@ -772,14 +867,28 @@ class Rig(object):
             ))
             pymel.delete(module.grp_rig)
 
-        # Prevent animators from accidentaly moving offset nodes
-        # TODO: Lock more?
+        # Resolve what is needed to apply ctrl color if needed
+        nomenclature_anm = None
+        color_by_side = None
+        if self._color_ctrl and module.grp_anm:
+            nomenclature_anm = module.get_nomenclature_anm()
+            color_by_side = self._get_ctrl_color_by_side()
+
+        # Walk the ctrls only once to lock their offset and apply their color.
         for ctrl in module.get_ctrls():
-            if libPymel.is_valid_PyNode(ctrl) and hasattr(ctrl, 'offset') and ctrl.offset:
+            if not libPymel.is_valid_PyNode(ctrl):
+                continue
+
+            # Prevent animators from accidentaly moving offset nodes
+            # TODO: Lock more?
+            if hasattr(ctrl, 'offset') and ctrl.offset:
                 ctrl.offset.t.lock()
                 ctrl.offset.r.lock()
                 ctrl.offset.s.lock()
 
+            if nomenclature_anm:
+                self._color_ctrl_by_side(ctrl, nomenclature_anm, color_by_side)
+
         # Parent modules grp_anm to main grp_anm
         if libPymel.is_valid_PyNode(module.grp_anm) and libPymel.is_valid_PyNode(self.grp_anm):
             module.grp_anm.setParent(self.grp_anm)
@@ -789,12 +898,11 @@ class Rig(object):
             module.grp_rig.setParent(self.grp_rig)
 
         # Connect globalScale attribute to each modules globalScale.
-        if module.globalScale:
-            pymel.connectAttr(self.grp_anm.globalScale, module.globalScale, force=True)
-
-        # Apply ctrl color if needed
-        if self._color_ctrl:
-            self.color_module_ctrl(module)
+        global_scale = module.globalScale
+        if global_scale:
+            cmds.connectAttr(
+                self.grp_anm.__melobject__() + '.globalScale', global_scale.__melobject__(), force=True
+            )
 
         # Store the version of omtk used to generate the rig.
         module.version = api.get_version()
@@ -852,14 +960,15 @@ class Rig(object):
         """
         self.info("Un-building")
 
-        self._unbuild_modules(strict=strict, **kwargs)
-        self._unbuild_nodes()
+        with self._build_context():
+            self._unbuild_modules(strict=strict, **kwargs)
+            self._unbuild_nodes()
 
-        # Remove any references to missing pynodes
-        # HACK --> Remove clean invalid PyNode
-        self._clean_invalid_pynodes()
-        if self.modules is None:
-            self.modules = []
+            # Remove any references to missing pynodes
+            # HACK --> Remove clean invalid PyNode
+            self._clean_invalid_pynodes()
+            if self.modules is None:
+                self.modules = []
 
         return True
 
@@ -872,26 +981,30 @@ class Rig(object):
             if obj in module.input:
                 return module
 
-    def color_module_ctrl(self, module):
-        #
-        # Set ctrls colors
-        #
-        color_by_side = {
+    def _get_ctrl_color_by_side(self):
+        return {
             self.nomenclature.SIDE_L: self.LEFT_CTRL_COLOR,  # Red
             self.nomenclature.SIDE_R: self.RIGHT_CTRL_COLOR  # Blue
         }
 
-        epsilon = 0.1
+    def _color_ctrl_by_side(self, ctrl, nomenclature_anm, color_by_side):
+        if not ctrl.drawOverride.overrideEnabled.get():
+            nomenclature_ctrl = nomenclature_anm.rebuild(ctrl.stripNamespace().nodeName())
+            side = nomenclature_ctrl.side
+            color = color_by_side.get(side, self.CENTER_CTRL_COLOR)
+            ctrl.drawOverride.overrideEnabled.set(1)
+            ctrl.drawOverride.overrideColor.set(color)
+
+    def color_module_ctrl(self, module):
+        #
+        # Set ctrls colors
+        #
         if module.grp_anm:
             nomenclature_anm = module.get_nomenclature_anm()
+            color_by_side = self._get_ctrl_color_by_side()
             for ctrl in module.get_ctrls():
                 if libPymel.is_valid_PyNode(ctrl):
-                    if not ctrl.drawOverride.overrideEnabled.get():
-                        nomenclature_ctrl = nomenclature_anm.rebuild(ctrl.stripNamespace().nodeName())
-                        side = nomenclature_ctrl.side
-                        color = color_by_side.get(side, self.CENTER_CTRL_COLOR)
-                        ctrl.drawOverride.overrideEnabled.set(1)
-                        ctrl.drawOverride.overrideColor.set(color)
+                    self._color_ctrl_by_side(ctrl, nomenclature_anm, color_by_side)
 
     #
     # Facial and avars utility methods
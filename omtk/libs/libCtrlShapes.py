@@ -4,6 +4,87 @@ from maya import cmds
 from omtk.libs import libRigging
 
 
+# Points of the shapes that are only scaled when created.
+_CROSS_POINTS = (
+    (0, -0.5, 0.5),
+    (0, -0.5, 1.0),
+    (0, 0.5, 1.0),
+    (0, 0.5, 0.5),
+    (0, 1.0, 0.5),
+    (0, 1.0, -0.5),
+    (0, 0.5, -0.5),
+    (0, 0.5, -1.0),
+    (0, -0.5, -1.0),
+    (0, -0.5, -0.5),
+    (0, -1.0, -0.5),
+    (0, -1.0, 0.5),
+    (0, -0.5, 0.5)
+)
+_ATTRHOLDER_POINTS = (
+    (0, 0, 1.0), (0, 0.7, 0.7), (0, 1.0, 0), (0, 0.7, -0.7), (0, 0, -1.0), (0, -0.7, -0.7), (0, -1.0, 0),
+    (0, -0.7, 0.7), (0, 0, 1.0), (-0.7, 0, 0.7), (-1.0, 0, 0), (-0.7, 0.7, 0), (0, 1.0, 0), (0.7, 0.7, 0),
+    (1.0, 0, 0), (0.7, 0, -0.7), (0, 0, -1.0), (-0.7, 0, -0.7), (-1.0, 0, 0), (-0.7, -0.7, 0), (0, -1.0, 0),
+    (0.7, -0.7, 0), (1.0, 0, 0), (0.7, 0, 0.7), (0, 0, 1.0), (-0.7, 0, 0.7)
+)
+
+
+def _scale_points(points, size):
+    return [(x * size, y * size, z * size) for x, y, z in points]
+
+
+def _create_linear_curve(points, name=None, **kwargs):
+    """
+    Lightweight alternative to pymel.curve(d=1, p=points).
+    :param points: A list of (x, y, z) positions.
+    :param name: The name of the new transform.
+    :param kwargs: Any other keyword argument is forwarded to cmds.curve.
+    :return: The new transform as a pymel.PyNode.
+    """
+    if name:
+        kwargs['name'] = name
+    transform = cmds.curve(degree=1, point=points, knot=range(len(points)), **kwargs)
+    return pymel.PyNode(transform)
+
+
+def _create_linear_curve_shape(parent, points):
+    """
+    Create a degree 1 nurbsCurve shape under an existing transform.
+    The curve is created with cmds so it is recorded in the undo queue, its temporary transform is then deleted.
+    :param parent: The name of the transform that will hold the shape.
+    :param points: A list of (x, y, z) positions.
+    :return: The name of the new shape.
+    """
+    transform = cmds.curve(degree=1, point=points, knot=range(len(points)))
+    shape = cmds.listRelatives(transform, shapes=True, fullPath=True)[0]
+    shape = cmds.parent(shape, parent, shape=True, relative=True)[0]
+    cmds.delete(transform)
+    return shape
+
+
+def _rotate_points(points, normal):
+    """
+    Orient points defined along the +Y axis so they point toward the provided normal.
+    Only the dominant component of the normal is considered, the same way as a 90 or 180 degree rotation would.
+    :param points: A list of (x, y, z) positions.
+    :param normal: A (x, y, z) direction, ex: (0, 0, 1).
+    :return: A new list of (x, y, z) positions.
+    """
+    normal_x, normal_y, normal_z = normal
+    if normal_x:
+        if normal_x < 0:
+            return [(-y, x, z) for x, y, z in points]  # rotateZ 90
+        return [(y, -x, z) for x, y, z in points]  # rotateZ -90
+    if normal_y:
+        if normal_y < 0:
+            return [(x, -y, -z) for x, y, z in points]  # rotateX 180
+        return list(points)
+    if normal_z:
+        if normal_z < 0:
+            return [(x, z, -y) for x, y, z in points]  # rotateX -90
+        return [(x, -z, y) for x, y, z in points]  # rotateX 90
+    return list(points)
+
+
 def create_shape_circle(size=1.0, normal=(1, 0, 0), *args, **kwargs):
     transform, make = pymel.circle(*args, **kwargs)
     make.radius.set(size)
@@ -18,8 +99,10 @@ def create_shape_circle(size=1.0, normal=(1, 0, 0), *args, **kwargs):
     return transform, make
 
 
-def create_shape_needle(size=1, length=None, radius=None, name=None, normal=(0, 1, 0), *args, **kwargs):
-    # TODO: docstring
+def _get_needle_points(size=1, length=None, radius=None):
+    """
+    :return: The points of the needle stem, the needle head front profile and the needle head top profile.
+    """
     # Resolve length
     # Default length is 4x the provided size
     if length is None:
@@ -37,11 +120,11 @@ def create_shape_needle(size=1, length=None, radius=None, name=None, normal=(0,
     xz_circle_rad = radius
     xz_circle_mid_rad = xz_circle_rad * 0.75
 
-    shape1 = pymel.curve(d=1, p=[
+    points_stem = [
         (0.0, 0.0, 0.0),
         (0.0, y_circle_min, 0.0)
-    ])
-    shape2 = pymel.curve(d=1, p=[
+    ]
+    points_head_front = [
         (0.0, y_circle_max, -0.0),
         (0.0, y_circle_max, 0.0),
         (xz_circle_mid_rad, y_circle_mid_max, 0.0),
@@ -53,8 +136,8 @@ def create_shape_needle(size=1, length=None, radius=None, name=None, normal=(0,
         (-xz_circle_mid_rad, y_circle_mid_max, 0.0),
         (0.0, y_circle_max, 0.0),
         (xz_circle_mid_rad, y_circle_mid_max, 0.0)
-    ])
-    shape3 = pymel.curve(d=1, p=[
+    ]
+    points_head_top = [
         (-xz_circle_mid_rad, length, -xz_circle_mid_rad),
         (-xz_circle_rad, length, 0.0),
         (-xz_circle_mid_rad, length, xz_circle_mid_rad),
@@ -66,36 +149,19 @@ def create_shape_needle(size=1, length=None, radius=None, name=None, normal=(0,
         (-xz_circle_mid_rad, length, -xz_circle_mid_rad),
         (-xz_circle_rad, length, 0.0),
         (-xz_circle_rad, length, 0.0)
-    ])
-    shape2.getShape().setParent(shape1, shape=True, relative=True)
-    shape3.getShape().setParent(shape1, shape=True, relative=True)
-    pymel.delete(shape2)
-    pymel.delete(shape3)
-
-    # Apply normal parameter
-    # TODO: Find a better way
-    need_identity = True
-    normal_x, normal_y, normal_z = normal
-    if normal_x:
-        if normal_x < 0:
-            shape1.rotateZ.set(90)
-        else:
-            shape1.rotateZ.set(-90)
-    elif normal_y:
-        if normal_y < 0:
-            shape1.rotateX.set(180)
-        else:
-            need_identity = False
-    elif normal_z:
-        if normal_z < 0:
-            shape1.rotateX.set(-90)
-        else:
-            shape1.rotateX.set(90)
-    if need_identity:
-        pymel.makeIdentity(shape1, apply=True, rotate=True)
+    ]
+    return points_stem, points_head_front, points_head_top
 
-    if name:
-        shape1.rename(name)
+
+def create_shape_needle(size=1, length=None, radius=None, name=None, normal=(0, 1, 0), *args, **kwargs):
+    # TODO: docstring
+    points_stem, points_head_front, points_head_top = _get_needle_points(size=size, length=length, radius=radius)
+
+    # Apply normal parameter directly on the points so we don't need to freeze the transform.
+    shape1 = _create_linear_curve(_rotate_points(points_stem, normal), name=name)
+    transform = shape1.__melobject__()
+    for points in (points_head_front, points_head_top):
+        _create_linear_curve_shape(transform, _rotate_points(points, normal))
 
     # Expose the rotateOrder
     shape1.rotateOrder.setKeyable(True)
@@ -103,13 +169,19 @@ def create_shape_needle(size=1, length=None, radius=None, name=None, normal=(0,
     return shape1
 
 
-def create_shape_double_needle(normal=(0, 1, 0), *args, **kwargs):
+def create_shape_double_needle(size=1, length=None, radius=None, name=None, normal=(0, 1, 0), *args, **kwargs):
     normal_inv = (normal[0] * -1, normal[1] * -1, normal[2] * -1)  # TODO: find an eleguant way
-    shape1 = create_shape_needle(normal=normal, *args, **kwargs)
-    shape2 = create_shape_needle(normal=normal_inv, *args, **kwargs)
-    for shape in shape2.getShapes():
-        shape.setParent(shape1, shape=True, relative=True)
-    pymel.delete(shape2)
+    points_stem, points_head_front, points_head_top = _get_needle_points(size=size, length=length, radius=radius)
+
+    # Both stems are on the same axis, we can draw them using a single line.
+    x, y, z = points_stem[-1]
+    points_stem = [(-x, -y, -z), (x, y, z)]
+
+    shape1 = _create_linear_curve(_rotate_points(points_stem, normal), name=name)
+    transform = shape1.__melobject__()
+    for points in (points_head_front, points_head_top):
+        _create_linear_curve_shape(transform, _rotate_points(points, normal))
+        _create_linear_curve_shape(transform, _rotate_points(points, normal_inv))
 
     # Expose the rotateOrder
     shape1.rotateOrder.setKeyable(True)
@@ -118,23 +190,7 @@ def create_shape_double_needle(normal=(0, 1, 0), *args, **kwargs):
 
 
 def create_shape_cross(size=1.0, **kwargs):
-    s1 = size * 0.5
-    s2 = size
-    node = pymel.curve(d=1, p=[
-        (0, -s1, s1),
-        (0, -s1, s2),
-        (0, s1, s2),
-        (0, s1, s1),
-        (0, s2, s1),
-        (0, s2, -s1),
-        (0, s1, -s1),
-        (0, s1, -s2),
-        (0, -s1, -s2),
-        (0, -s1, -s1),
-        (0, -s2, -s1),
-        (0, -s2, s1),
-        (0, -s1, s1)
-    ], **kwargs)
+    node = _create_linear_curve(_scale_points(_CROSS_POINTS, size), **kwargs)
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
@@ -143,13 +199,7 @@ def create_shape_cross(size=1.0, **kwargs):
 
 
 def create_shape_attrholder(size=1.0, **kwargs):
-    s1 = size
-    s2 = s1 * 0.7
-    node = pymel.curve(d=1,
-                       p=[(0, 0, s1), (0, s2, s2), (0, s1, 0), (0, s2, -s2), (0, 0, -s1), (0, -s2, -s2), (0, -s1, 0),
-                          (0, -s2, s2), (0, 0, s1), (-s2, 0, s2), (-s1, 0, 0), (-s2, s2, 0), (0, s1, 0), (s2, s2, 0),
-                          (s1, 0, 0), (s2, 0, -s2), (0, 0, -s1), (-s2, 0, -s2), (-s1, 0, 0), (-s2, -s2, 0), (0, -s1, 0),
-                          (s2, -s2, 0), (s1, 0, 0), (s2, 0, s2), (0, 0, s1), (-s2, 0, s2)], k=range(26), *kwargs)
+    node = _create_linear_curve(_scale_points(_ATTRHOLDER_POINTS, size), **kwargs)
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
@@ -164,9 +214,9 @@ def create_shape_box(size=1.0, r=None, h=None):
     if h is None:
         h = size / 5.0
 
-    node = pymel.curve(d=1, p=[(-r, -h, r), (-r, h, r), (r, h, r), (r, -h, r), (-r, -h, r), (-r, -h, -r), (-r, h, -r),
-                               (-r, h, r), (r, h, r), (r, h, -r), (r, -h, -r), (r, -h, r), (r, -h, -r), (-r, -h, -r),
-                               (-r, h, -r), (r, h, -r)])
+    node = _create_linear_curve([(-r, -h, r), (-r, h, r), (r, h, r), (r, -h, r), (-r, -h, r), (-r, -h, -r), (-r, h, -r),
+                                 (-r, h, r), (r, h, r), (r, h, -r), (r, -h, -r), (r, -h, r), (r, -h, -r), (-r, -h, -r),
+                                 (-r, h, -r), (r, h, -r)])
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
@@ -389,7 +439,7 @@ def create_triangle_upp(size=1.0):
     p1 = [0, 0.577 * size, 0]
     p2 = [-0.5 * size, -0.288 * size, 0]
     p3 = [0.5 * size, -0.288 * size, 0]
-    node = pymel.curve(d=1, p=[p1, p2, p3, p1])
+    node = _create_linear_curve([p1, p2, p3, p1])
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
@@ -401,7 +451,7 @@ def create_triangle_low(size=1.0):
     p1 = [0, -0.577 * size, 0]
     p2 = [-0.5 * size, 0.288 * size, 0]
     p3 = [0.5 * size, 0.288 * size, 0]
-    node = pymel.curve(d=1, p=[p1, p2, p3, p1])
+    node = _create_linear_curve([p1, p2, p3, p1])
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
@@ -413,7 +463,7 @@ def create_triangle_left(size=1.0):
     p1 = [0.577 * size, 0, 0]
     p2 = [-0.288 * size, -0.5 * size, 0]
     p3 = [-0.288 * size, 0.5 * size, 0]
-    node = pymel.curve(d=1, p=[p1, p2, p3, p1])
+    node = _create_linear_curve([p1, p2, p3, p1])
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
@@ -425,7 +475,7 @@ def create_triangle_right(size=1.0):
     p1 = [-0.577 * size, 0, 0]
     p2 = [0.288 * size, -0.5 * size, 0]
     p3 = [0.288 * size, 0.5 * size, 0]
-    node = pymel.curve(d=1, p=[p1, p2, p3, p1])
+    node = _create_linear_curve([p1, p2, p3, p1])
 
     # Expose the rotateOrder
     node.rotateOrder.setKeyable(True)
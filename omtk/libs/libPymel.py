@@ -22,6 +22,44 @@ def distance_between_nodes(x, y):
     return ((ax - bx) ** 2 + (ay - b) ** 2 + (az - bz) ** 2) ** 0.5
 
 
+def get_world_translations(objs):
+    """
+    Return the world translation of multiple transforms using a single api query.
+    :param objs: A list of pymel.nodetypes.Transform (or any object implementing __melobject__).
+    :return: A list of pymel.datatypes.Vector.
+    """
+    sel = OpenMaya.MSelectionList()
+    dag_path = OpenMaya.MDagPath()
+    result = []
+    for obj in objs:
+        sel.clear()
+        sel.add(obj.__melobject__())
+        sel.getDagPath(0, dag_path)
+        pos = OpenMaya.MTransformationMatrix(dag_path.inclusiveMatrix()).getTranslation(OpenMaya.MSpace.kWorld)
+        result.append(pymel.datatypes.Vector(pos.x, pos.y, pos.z))
+    return result
+
+
+def get_local_translations(objs):
+    """
+    Return the local translation of multiple transforms using a single api function set.
+    :param objs: A list of pymel.nodetypes.Transform (or any object implementing __melobject__).
+    :return: A list of pymel.datatypes.Vector.
+    """
+    sel = OpenMaya.MSelectionList()
+    dag_path = OpenMaya.MDagPath()
+    fn_transform = OpenMaya.MFnTransform()
+    result = []
+    for obj in objs:
+        sel.clear()
+        sel.add(obj.__melobject__())
+        sel.getDagPath(0, dag_path)
+        fn_transform.setObject(dag_path)
+        pos = fn_transform.getTranslation(OpenMaya.MSpace.kTransform)
+        result.append(pymel.datatypes.Vector(pos.x, pos.y, pos.z))
+    return result
+
+
 def distance_between_vectors(a, b):
     """
     http://darkvertex.com/wp/2010/06/05/python-distance-between-2-vectors/
@@ -64,12 +102,9 @@ class PyNodeChain(list):
 
     # todo: convert to property?
     def length(self):
-        length = 0
-        for i in range(len(self) - 1):
-            head = self[i]
-            tail = self[i + 1]
-            length += distance_between_nodes(head, tail)
-        return length
+        # Note: Each node is only queried once.
+        positions = get_world_translations(self)
+        return sum((tail - head).length() for head, tail in zip(positions, positions[1:]))
 
     # get the first pynode that have the attr
     def __getattr__(self, key):
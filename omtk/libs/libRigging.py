@@ -62,6 +62,54 @@ def create_utility_node(_sClass, name=None, *args, **kwargs):
     return uNode
 
 
+def get_plug_name(val):
+    """
+    :param val: A pymel.Attribute or a plug name.
+    :return: The plug name.
+    """
+    return val if isinstance(val, basestring) else val.__melobject__()
+
+
+def _connect_or_set_plug(node, attr_name, plug, val, indexed=False):
+    if isinstance(val, (list, tuple)):
+        # Note: List attribute and compound attribute don't have the same way of iterating.
+        if not indexed and cmds.attributeQuery(attr_name, node=node, multi=True):
+            for i, sub_val in enumerate(val):
+                _connect_or_set_plug(node, attr_name, '{0}[{1}]'.format(plug, i), sub_val, indexed=True)
+        else:
+            children = cmds.attributeQuery(attr_name, node=node, listChildren=True)
+            if not children:
+                raise Exception("Can't apply value {0} on attribute {1}, need an array or compound".format(val, plug))
+            for child, sub_val in zip(children, val):
+                _connect_or_set_plug(node, child, '{0}.{1}'.format(plug, child), sub_val)
+    elif isinstance(val, (basestring, pymel.Attribute)):
+        cmds.connectAttr(get_plug_name(val), plug, force=True)
+    elif isinstance(val, pymel.datatypes.Matrix):
+        cmds.setAttr(plug, [x for row in val for x in row], type='matrix')
+    elif isinstance(val, (pymel.datatypes.Vector, pymel.datatypes.Point)):
+        cmds.setAttr(plug, val.x, val.y, val.z)
+    elif is_basic_type(val):
+        cmds.setAttr(plug, val)
+    else:
+        raise TypeError(
+            '[ConnectOrSetPlug] Invalid value for attribute {} of type {} and value {}'.format(plug, type(val), val))
+
+
+def create_utility_node_fast(_sClass, name=None, **kwargs):
+    """
+    Alternative to create_utility_node that use cmds and return the node name instead of a PyNode.
+    Use it when creating a lot of nodes that never need to be manipulated using pymel.
+    :param _sClass: The type of the node to create.
+    :param name: The name of the node to create.
+    :param kwargs: The value or pymel.Attribute/plug name to set or connect on each attribute of the node.
+    :return: The name of the created node.
+    """
+    node = cmds.createNode(_sClass, name=name) if name else cmds.createNode(_sClass)
+    for attr_name, val in kwargs.items():
+        _connect_or_set_plug(node, attr_name, '{0}.{1}'.format(node, attr_name), val)
+    return node
+
+
 #
 # CtrlShapes Backup
 #
@@ -262,7 +310,6 @@ def create_squash_atts(attr_stretch, samples):
     :param attr_stretch: # The stretch attribute.
     :param samples: Number of samples to resolve.
     """
-    import libFormula
     if not isinstance(attr_stretch, pymel.Attribute):
         raise IOError("Expected pymel Attribute, got {0} ({1})".format(attr_stretch, type(attr_stretch)))
 
@@ -276,13 +323,12 @@ def create_squash_atts(attr_stretch, samples):
         # 0 = Maximum Squash
         # 1 = No Squash
         # see see: http://www.wolframalpha.com/input/?i=%28x%5E2-1%29*-1
-        blend = libFormula.parse("x^2", x=pos)
+        blend = pos ** 2
 
-        attr_squash = libFormula.parse("((max-min)*blend)+min",
-                                       min=attr_stretch_inv,
-                                       max=1,
-                                       blend=blend
-                                       )
+        # Since the blend is constant, ((1-min)*blend)+min can be resolved by a single blendTwoAttr.
+        attr_squash = create_utility_node('blendTwoAttr',
+                                          input=[attr_stretch_inv, 1.0],
+                                          attributesBlender=blend).output
 
         return_vals.append(attr_squash)
     return return_vals
@@ -1020,24 +1066,26 @@ def get_closest_point_on_surface(nurbsSurface, pos):
     if not isinstance(nurbsSurface, pymel.nodetypes.NurbsSurface):
         raise IOError("Unexpected datatype. Expected NurbsSurface, got {0}".format(type(nurbsSurface)))
 
-    # closestPointOnSurface don't listen to transform so we'll need to duplicate the shape.
-    util_cpos = create_utility_node('closestPointOnSurface',
-                                    inPosition=pos,
-                                    inputSurface=nurbsSurface.worldSpace
-                                    )
-
-    pos = util_cpos.position.get()
-    u = util_cpos.parameterU.get()
-    v = util_cpos.parameterV.get()
+    # Query the surface directly instead of creating and evaluating a temporary closestPointOnSurface node.
+    mfn_surface = nurbsSurface.__apimfn__()
+    utils = [OpenMaya.MScriptUtil() for _ in range(6)]
+    ptr_u, ptr_v, ptr_min_u, ptr_max_u, ptr_min_v, ptr_max_v = [util.asDoublePtr() for util in utils]
+    mpoint = mfn_surface.closestPoint(
+        OpenMaya.MPoint(pos[0], pos[1], pos[2]), ptr_u, ptr_v, False, 1.0e-3, OpenMaya.MSpace.kWorld
+    )
+    pos = pymel.datatypes.Vector(mpoint.x, mpoint.y, mpoint.z)
+    u = OpenMaya.MScriptUtil.getDouble(ptr_u)
+    v = OpenMaya.MScriptUtil.getDouble(ptr_v)
 
     # follicles use normalized uv's when attaching to nurbs so we need to know the uv min max values
-    surface_min_u, surface_max_u = nurbsSurface.minMaxRangeU.get()
-    surface_min_v, surface_max_v = nurbsSurface.minMaxRangeV.get()
+    mfn_surface.getKnotDomain(ptr_min_u, ptr_max_u, ptr_min_v, ptr_max_v)
+    surface_min_u = OpenMaya.MScriptUtil.getDouble(ptr_min_u)
+    surface_max_u = OpenMaya.MScriptUtil.getDouble(ptr_max_u)
+    surface_min_v = OpenMaya.MScriptUtil.getDouble(ptr_min_v)
+    surface_max_v = OpenMaya.MScriptUtil.getDouble(ptr_max_v)
     u = abs((u - surface_min_u) / (surface_max_u - surface_min_u))
     v = abs((v - surface_min_v) / (surface_max_v - surface_min_v))
 
-    pymel.delete(util_cpos)
-
     return pos, u, v
 
 
@@ -2,9 +2,11 @@
 An avar is a facial control unit inspired from The Art of Moving Points.
 This is the foundation for the facial animation modules.
 """
+import contextlib
 import logging
 
 import pymel.core as pymel
+from maya import cmds
 
 from omtk.core import classCtrl
 from omtk.core import classModule
@@ -19,13 +21,103 @@ from omtk.libs import libRigging
 log = logging.getLogger('omtk')
 
 
+@contextlib.contextmanager
+def _undo_chunk():
+    cmds.undoInfo(openChunk=True)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+
+def _get_input_plug(plug, **kwargs):
+    plugs_input = cmds.listConnections(plug, source=True, destination=False, plugs=True, **kwargs)
+    return plugs_input[0] if plugs_input else None
+
+
+def _attr_have_animcurve_input(plug, cache):
+    """
+    Check if an attribute is driven by an animCurve, either directly or through a blendWeighted node.
+    :param plug: The name of the attribute to inspect.
+    :param cache: A dict used to remember the result of each blendWeighted node already inspected.
+    :return: True if an animCurve drive the attribute.
+    """
+    plug_input = _get_input_plug(plug, skipConversionNodes=True)
+    if plug_input is None:
+        return False
+
+    node_input = plug_input.split('.', 1)[0]
+
+    if cmds.objectType(node_input, isAType='animCurve'):
+        return True
+
+    if cmds.objectType(node_input) == 'blendWeighted':
+        result = cache.get(node_input)
+        if result is None:
+            # Mark the node before walking it to protect ourself from cycles.
+            cache[node_input] = False
+            result = any(
+                _attr_have_animcurve_input('{0}.input[{1}]'.format(node_input, index), cache)
+                for index in cmds.getAttr(node_input + '.input', multiIndices=True) or []
+            )
+            cache[node_input] = result
+        return result
+
+    return False
+
+
+def _transfer_output_connections(plug_src, plug_dst):
+    # Resolve the commands once since an avar can drive a lot of attributes.
+    fn_disconnect = cmds.disconnectAttr
+    fn_connect = cmds.connectAttr
+    for plug_src_out in cmds.listConnections(plug_src, source=False, destination=True, plugs=True) or []:
+        fn_disconnect(plug_src, plug_src_out)
+        fn_connect(plug_dst, plug_src_out)
+
+
+def _connect_attrs(connections):
+    """
+    Connect multiple attributes using cmds.
+    :param connections: An iterable of (source, destination) pymel.Attribute or plug name.
+    """
+    fn_connect = cmds.connectAttr
+    fn_get_plug_name = libRigging.get_plug_name
+    for attr_src, attr_dst in connections:
+        fn_connect(fn_get_plug_name(attr_src), fn_get_plug_name(attr_dst))
+
+
+def _create_follicle(surface_shape, u, v, name, parent):
+    """
+    Create a follicle on a nurbsSurface using cmds.
+    :param surface_shape: The name of the nurbsSurface shape.
+    :param u: The value of the follicle parameterU.
+    :param v: The value of the follicle parameterV.
+    :param name: The name of the follicle transform.
+    :param parent: The name of the follicle transform parent.
+    :return: The follicle transform as a pymel.nodetypes.Transform.
+    """
+    transform = cmds.createNode('transform', name=name, parent=parent)
+    shape = cmds.createNode('follicle', name=name + 'Shape', parent=transform)
+    cmds.setAttr(shape + '.parameterU', u)
+    cmds.setAttr(shape + '.parameterV', v)
+    cmds.connectAttr(surface_shape + '.worldSpace[0]', shape + '.inputSurface')
+    cmds.connectAttr(shape + '.outTranslate', transform + '.translate')
+    cmds.connectAttr(shape + '.outRotate', transform + '.rotate')
+    return pymel.PyNode(transform)
+
+
 class BaseCtrlFace(classCtrl.BaseCtrl):
     def fetch_shapes(self):
         """
         Face ctrls CAN have non-uniform scaling. To circumvent this we'll remove the ctrl rotation when attaching.
         This is because the shape is fetch in local space (this allow an arm ctrl to snap to the right location if the arm length change).
         """
-        libPymel.makeIdentity_safe(self.shapes, rotate=True, scale=True, apply=True)
+        # The held shapes are rarely locked or connected, try the direct command first and only
+        # fallback to the slower safe version if it fail.
+        try:
+            cmds.makeIdentity(self.shapes.__melobject__(), rotate=True, scale=True, apply=True)
+        except RuntimeError:
+            libPymel.makeIdentity_safe(self.shapes, rotate=True, scale=True, apply=True)
 
         super(BaseCtrlFace, self).fetch_shapes()
         # libRigging.fetch_ctrl_shapes(self.shapes, self.node)
@@ -129,16 +221,25 @@ class AbstractAvar(classModule.Module):
         :return: The avar attribute holder.
         """
         # Define macro avars
-        libAttr.addAttr_separator(attr_holder, 'avars')
-        self.attr_ud = self.add_avar(attr_holder, self.AVAR_NAME_UD)
-        self.attr_lr = self.add_avar(attr_holder, self.AVAR_NAME_LR)
-        self.attr_fb = self.add_avar(attr_holder, self.AVAR_NAME_FB)
-        self.attr_yw = self.add_avar(attr_holder, self.AVAR_NAME_YAW)
-        self.attr_pt = self.add_avar(attr_holder, self.AVAR_NAME_PITCH)
-        self.attr_rl = self.add_avar(attr_holder, self.AVAR_NAME_ROLL)
-        self.attr_sx = self.add_avar(attr_holder, self.AVAR_NAME_SX, defaultValue=1.0)
-        self.attr_sy = self.add_avar(attr_holder, self.AVAR_NAME_SY, defaultValue=1.0)
-        self.attr_sz = self.add_avar(attr_holder, self.AVAR_NAME_SZ, defaultValue=1.0)
+        avars = (
+            ('attr_ud', self.AVAR_NAME_UD, 0.0),
+            ('attr_lr', self.AVAR_NAME_LR, 0.0),
+            ('attr_fb', self.AVAR_NAME_FB, 0.0),
+            ('attr_yw', self.AVAR_NAME_YAW, 0.0),
+            ('attr_pt', self.AVAR_NAME_PITCH, 0.0),
+            ('attr_rl', self.AVAR_NAME_ROLL, 0.0),
+            ('attr_sx', self.AVAR_NAME_SX, 1.0),
+            ('attr_sy', self.AVAR_NAME_SY, 1.0),
+            ('attr_sz', self.AVAR_NAME_SZ, 1.0),
+        )
+
+        # Note: We use cmds since each libAttr.addAttr call would wrap the new attribute.
+        node = attr_holder.__melobject__()
+        with _undo_chunk():
+            libAttr.addAttr_separator(attr_holder, 'avars')
+            for member_name, attr_name, default_value in avars:
+                cmds.addAttr(node, longName=attr_name, keyable=True, defaultValue=default_value)
+                setattr(self, member_name, attr_holder.attr(attr_name))
 
     def hold_avars(self):
         """
@@ -156,43 +257,27 @@ class AbstractAvar(classModule.Module):
         self.rig.hold_node(self.avar_network)
         self.add_avars(self.avar_network)
 
-        def attr_have_animcurve_input(attr):
-            attr_input = next(iter(attr.inputs(plugs=True, skipConversionNodes=True)), None)
-            if attr_input is None:
-                return False
-
-            attr_input_node = attr_input.node()
-
-            if isinstance(attr_input_node, pymel.nodetypes.AnimCurve):
-                return True
-
-            if isinstance(attr_input_node, pymel.nodetypes.BlendWeighted):
-                for blendweighted_input in attr_input_node.input:
-                    if attr_have_animcurve_input(blendweighted_input):
-                        return True
-
-            return False
-
-        attrs = pymel.listAttr(self.avar_network, userDefined=True)
-        for attr_name in attrs:
-            if not self.grp_rig.hasAttr(attr_name):
-                self.debug("Cannot hold missing attribute {0} in {1}".format(attr_name, self.grp_rig))
-                continue
+        # Note: We use cmds since pymel would wrap every attributes and connections.
+        grp_rig = self.grp_rig.__melobject__()
+        avar_network = self.avar_network.__melobject__()
+        cache = {}  # Shared between avars since they can be driven by the same blendWeighted nodes.
+        grp_rig_attr_names = set(cmds.listAttr(grp_rig, userDefined=True) or [])
+        with _undo_chunk():
+            for attr_name in cmds.listAttr(avar_network, userDefined=True) or []:
+                if attr_name not in grp_rig_attr_names:
+                    self.debug("Cannot hold missing attribute {0} in {1}".format(attr_name, self.grp_rig))
+                    continue
 
-            # attr_name = attr.longName()
-            attr_src = self.grp_rig.attr(attr_name)
-            attr_dst = self.avar_network.attr(attr_name)
-            # libAttr.transfer_connections(attr_src, attr_dst)
+                plug_src = '{0}.{1}'.format(grp_rig, attr_name)
+                plug_dst = '{0}.{1}'.format(avar_network, attr_name)
 
-            if attr_have_animcurve_input(attr_src):
-                attr_src_inn = next(iter(attr_src.inputs(plugs=True)), None)
-                pymel.disconnectAttr(attr_src_inn, attr_src)
-                pymel.connectAttr(attr_src_inn, attr_dst)
+                if _attr_have_animcurve_input(plug_src, cache):
+                    plug_src_inn = _get_input_plug(plug_src)
+                    cmds.disconnectAttr(plug_src_inn, plug_src)
+                    cmds.connectAttr(plug_src_inn, plug_dst)
 
-            # Transfer output connections
-            for attr_src_out in attr_src.outputs(plugs=True):
-                pymel.disconnectAttr(attr_src, attr_src_out)
-                pymel.connectAttr(attr_dst, attr_src_out)
+                # Transfer output connections
+                _transfer_output_connections(plug_src, plug_dst)
 
     def fetch_avars(self):
         """
@@ -200,21 +285,49 @@ class AbstractAvar(classModule.Module):
         we'll transfert thoses connections back to the grp_rig node.
         Note that the avars have to been added to the grp_rig before..
         """
-        if libPymel.is_valid_PyNode(self.avar_network):
-            for attr_name in pymel.listAttr(self.avar_network, userDefined=True):
-                attr_src = self.avar_network.attr(attr_name)
-                if not self.grp_rig.hasAttr(attr_name):
+        if self.avar_network is None:
+            return
+
+        # Forget about any backup network that was deleted since.
+        if not libPymel.is_valid_PyNode(self.avar_network):
+            self.avar_network = None
+            return
+
+        # Note: We use cmds since pymel would wrap every attributes and connections.
+        grp_rig = self.grp_rig.__melobject__()
+        avar_network = self.avar_network.__melobject__()
+        grp_rig_attr_names = set(cmds.listAttr(grp_rig, userDefined=True) or [])
+        with _undo_chunk():
+            for attr_name in cmds.listAttr(avar_network, userDefined=True) or []:
+                if attr_name not in grp_rig_attr_names:
                     self.warning("Can't fetch stored avar named {0}!".format(attr_name))
                     continue
-                attr_dst = self.grp_rig.attr(attr_name)
-                libAttr.transfer_connections(attr_src, attr_dst)
+
+                plug_src = '{0}.{1}'.format(avar_network, attr_name)
+                plug_dst = '{0}.{1}'.format(grp_rig, attr_name)
+
+                # Transfer input connections
+                plug_src_inn = _get_input_plug(plug_src)
+                if plug_src_inn:
+                    cmds.disconnectAttr(plug_src_inn, plug_src)
+                    cmds.connectAttr(plug_src_inn, plug_dst)
+
+                # Transfer output connections
+                _transfer_output_connections(plug_src, plug_dst)
 
             # Ensure Maya don't delete our networks when removing the backup node...
-            pymel.disconnectAttr(self.avar_network.message)
-            pymel.delete(self.avar_network)
-            self.avar_network = None
+            plug_message = avar_network + '.message'
+            for plug_message_out in cmds.listConnections(plug_message, source=False, destination=True, plugs=True) or []:
+                cmds.disconnectAttr(plug_message, plug_message_out)
+            cmds.delete(avar_network)
+        self.avar_network = None
 
     def unbuild(self):
+        # The memoized nomenclatures are kept for the whole build.
+        # Reset them so the avars backup use the current module name even if it changed since the build.
+        if '_cache' in self.__dict__:
+            self.__dict__.pop('_cache')
+
         self.hold_avars()
         self.init_avars()
 
@@ -233,12 +346,12 @@ class AbstractAvar(classModule.Module):
         fol_pos, fol_u, fol_v = libRigging.get_closest_point_on_surface(self.surface, pos)
         return fol_u, fol_v
 
+    @libPython.memoized_instancemethod
     def get_jnt_tm(self):
         """
         :return: The deformer pivot transformation.
         """
         # TODO: What do we do with the rotation?
-        tm = self.jnt.getMatrix(worldSpace=True)
         pos = self.jnt.getTranslation(space='world')
         return pymel.datatypes.Matrix(
             1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, pos.x, pos.y, pos.z, 1
@@ -261,74 +374,73 @@ class AbstractAvar(classModule.Module):
         """
         nomenclature = self.get_nomenclature_rig().copy()
         nomenclature.add_tokens(name)
+        names = dict((token, nomenclature.resolve(token)) for token in (
+            'SurfaceGrp', 'Surface',
+            'SideBend', 'UppBend', 'LowBend',
+            'SideBendHandle', 'UppBendHandle', 'LowBendHandle'
+        ))
+
+        # Note: We use cmds since pymel would wrap every intermediate nodes and attributes.
+        with _undo_chunk():
+            root = cmds.createNode('transform', name=names['SurfaceGrp'])
+            cmds.addAttr(root, longName='bendUpp', k=True)
+            cmds.addAttr(root, longName='bendLow', k=True)
+            cmds.addAttr(root, longName='bendSide', k=True)
+
+            # Create Guide
+            plane_transform, _ = cmds.nurbsPlane(patchesU=4, patchesV=4, name=names['Surface'])
+
+            # Create Bends
+            bend_side_deformer, bend_side_handle = cmds.nonLinear(
+                plane_transform, type='bend', name=names['SideBend']
+            )
+            bend_upp_deformer, bend_upp_handle = cmds.nonLinear(
+                plane_transform, type='bend', name=names['UppBend']
+            )
+            bend_low_deformer, bend_low_handle = cmds.nonLinear(
+                plane_transform, type='bend', name=names['LowBend']
+            )
+            bend_side_handle = cmds.rename(bend_side_handle, names['SideBendHandle'])
+            bend_upp_handle = cmds.rename(bend_upp_handle, names['UppBendHandle'])
+            bend_low_handle = cmds.rename(bend_low_handle, names['LowBendHandle'])
+
+            cmds.setAttr(plane_transform + '.rotate', 0, -90, 0)
+            cmds.setAttr(bend_side_handle + '.rotate', 90, 90, 0)
+            cmds.setAttr(bend_upp_handle + '.rotate', 180, 90, 0)
+            cmds.setAttr(bend_low_handle + '.rotate', 180, 90, 0)
+            cmds.setAttr(bend_upp_deformer + '.highBound', 0)
+            cmds.setAttr(bend_low_deformer + '.lowBound', 0)
 
-        root = pymel.createNode('transform')
-        pymel.addAttr(root, longName='bendUpp', k=True)
-        pymel.addAttr(root, longName='bendLow', k=True)
-        pymel.addAttr(root, longName='bendSide', k=True)
-
-        # Create Guide
-        plane_transform, plane_make = pymel.nurbsPlane(patchesU=4, patchesV=4)
-
-        # Create Bends
-        bend_side_deformer, bend_side_handle = pymel.nonLinear(plane_transform, type='bend')
-        bend_upp_deformer, bend_upp_handle = pymel.nonLinear(plane_transform, type='bend')
-        bend_low_deformer, bend_low_handle = pymel.nonLinear(plane_transform, type='bend')
-
-        plane_transform.r.set(0, -90, 0)
-        bend_side_handle.r.set(90, 90, 0)
-        bend_upp_handle.r.set(180, 90, 0)
-        bend_low_handle.r.set(180, 90, 0)
-        bend_upp_deformer.highBound.set(0)  # create pymel warning
-        bend_low_deformer.lowBound.set(0)  # create pymel warning
-
-        plane_transform.setParent(root)
-        bend_side_handle.setParent(root)
-        bend_upp_handle.setParent(root)
-        bend_low_handle.setParent(root)
-
-        pymel.connectAttr(root.bendSide, bend_side_deformer.curvature)
-        pymel.connectAttr(root.bendUpp, bend_upp_deformer.curvature)
-        pymel.connectAttr(root.bendLow, bend_low_deformer.curvature)
-
-        # Rename all the things!
-        root.rename(nomenclature.resolve('SurfaceGrp'))
-        plane_transform.rename(nomenclature.resolve('Surface'))
-        bend_upp_deformer.rename(nomenclature.resolve('UppBend'))
-        bend_low_deformer.rename(nomenclature.resolve('LowBend'))
-        bend_side_deformer.rename(nomenclature.resolve('SideBend'))
-        bend_upp_handle.rename(nomenclature.resolve('UppBendHandle'))
-        bend_low_handle.rename(nomenclature.resolve('LowBendHandle'))
-        bend_side_handle.rename(nomenclature.resolve('SideBendHandle'))
+            # Keep a reference to the surface that will survive the re-parenting.
+            surface = pymel.PyNode(plane_transform)
+            cmds.parent(plane_transform, bend_side_handle, bend_upp_handle, bend_low_handle, root)
+
+            cmds.connectAttr(root + '.bendSide', bend_side_deformer + '.curvature')
+            cmds.connectAttr(root + '.bendUpp', bend_upp_deformer + '.curvature')
+            cmds.connectAttr(root + '.bendLow', bend_low_deformer + '.curvature')
 
         # Try to guess the desired position
-        min_x = None
-        max_x = None
-        pos = pymel.datatypes.Vector()
-        for jnt in self.jnts:
-            pos += jnt.getTranslation(space='world')
-            if min_x is None or pos.x < min_x:
-                min_x = pos.x
-            if max_x is None or pos.x > max_x:
-                max_x = pos.x
-        pos /= len(self.jnts)
-        root.setTranslation(pos)
+        # Note: The position of all the influences are queried at once.
+        num_jnts = len(self.jnts)
+        values = cmds.xform([jnt.__melobject__() for jnt in self.jnts], query=True, worldSpace=True, translation=True)
+        xs = values[0::3]
+        ys = values[1::3]
+        zs = values[2::3]
+        cmds.setAttr(root + '.translate', sum(xs) / num_jnts, sum(ys) / num_jnts, sum(zs) / num_jnts)
 
         # Try to guess the scale
-        length_x = max_x - min_x
-        if len(self.jnts) <= 1 or length_x < epsilon:
+        length_x = max(xs) - min(xs)
+        if num_jnts <= 1 or length_x < epsilon:
             log.debug("Cannot automatically resolve scale for surface. Using default value {0}".format(default_scale))
             length_x = default_scale
 
-        root.scaleX.set(length_x)
-        root.scaleY.set(length_x * 0.5)
-        root.scaleZ.set(length_x)
+        cmds.setAttr(root + '.scale', length_x, length_x * 0.5, length_x)
 
-        pymel.select(root)
+        cmds.select(root)
 
-        # self.input.append(plane_transform)
+        # self.input.append(surface)
 
-        return plane_transform
+        return surface
 
     def build(self, mult_u=1.0, mult_v=1.0, **kwargs):
         """
@@ -360,7 +472,8 @@ class AbstractAvar(classModule.Module):
     def iter_ctrls(self):
         for ctrl in super(AbstractAvar, self).iter_ctrls():
             yield ctrl
-        yield self.ctrl
+        if self.ctrl is not None:
+            yield self.ctrl
 
     def parent_to(self, parent):
         """
@@ -439,20 +552,15 @@ class AvarSimple(AbstractAvar):
 
         # Create an offset layer that define the starting point of the Avar.
         # It is important that the offset is in this specific node since it will serve as
-        # a reference to re-computer the base u and v parameter if the rigger change the
-        # size of the surface when the system is build.
+        # a reference to compute the base u and v parameter when the system is build.
         grp_offset_name = nomenclature_rig.resolve('offset')
-        self._grp_offset = pymel.createNode('transform', name=grp_offset_name)
-        self._grp_offset.rename(grp_offset_name)
-        self._grp_offset.setParent(self.grp_rig)
+        self._grp_offset = pymel.createNode('transform', name=grp_offset_name, parent=self.grp_rig)
         # layer_offset.setMatrix(jnt_tm)
 
         # Create a parent layer for constraining.
         # Do not use dual constraint here since it can result in flipping issues.
         grp_parent_name = nomenclature_rig.resolve('parent')
-        self._grp_parent = pymel.createNode('transform', name=grp_parent_name)
-        self._grp_parent.setParent(self._grp_offset)
-        self._grp_parent.rename(grp_parent_name)
+        self._grp_parent = pymel.createNode('transform', name=grp_parent_name, parent=self._grp_offset)
 
         # Move the grp_offset to it's desired position.
         self._grp_offset.setTranslation(jnt_pos)
@@ -468,20 +576,26 @@ class AvarSimple(AbstractAvar):
         self._grp_output = pymel.createNode('transform', name=grp_output_name)
         self._grp_output.setParent(self._grp_parent)
 
-        attr_get_stack_local_tm = libRigging.create_utility_node(
-            'multMatrix',
-            matrixIn=(
-                self._stack.node.worldMatrix,
-                self._grp_offset.worldInverseMatrix
+        # If the stack is directly under the offset group, it's local transform is already what we need.
+        if self._stack.node.getParent() == self._grp_offset:
+            pymel.connectAttr(self._stack.node.t, self._grp_output.t)
+            pymel.connectAttr(self._stack.node.r, self._grp_output.r)
+            pymel.connectAttr(self._stack.node.s, self._grp_output.s)
+        else:
+            attr_get_stack_local_tm = libRigging.create_utility_node(
+                'multMatrix',
+                matrixIn=(
+                    self._stack.node.worldMatrix,
+                    self._grp_offset.worldInverseMatrix
+                )
+            ).matrixSum
+            util_get_stack_local_tm = libRigging.create_utility_node(
+                'decomposeMatrix',
+                inputMatrix=attr_get_stack_local_tm
             )
-        ).matrixSum
-        util_get_stack_local_tm = libRigging.create_utility_node(
-            'decomposeMatrix',
-            inputMatrix=attr_get_stack_local_tm
-        )
-        pymel.connectAttr(util_get_stack_local_tm.outputTranslate, self._grp_output.t)
-        pymel.connectAttr(util_get_stack_local_tm.outputRotate, self._grp_output.r)
-        pymel.connectAttr(util_get_stack_local_tm.outputScale, self._grp_output.s)
+            pymel.connectAttr(util_get_stack_local_tm.outputTranslate, self._grp_output.t)
+            pymel.connectAttr(util_get_stack_local_tm.outputRotate, self._grp_output.r)
+            pymel.connectAttr(util_get_stack_local_tm.outputScale, self._grp_output.s)
 
         # We connect the joint before creating the controllers.
         # This allow our doritos to work out of the box and allow us to compute their sensibility automatically.
@@ -649,6 +763,13 @@ class AvarFollicle(AvarSimple):
         self._attr_length_v = None
         self._attr_length_u = None
 
+        # Set by the avar group at build time.
+        self._parent_module = None
+
+        # If the avar is guaranteed to stay inside the surface [0, 1] uv range, the out-of-bound network can be skipped.
+        # This is a public member so the rigger choice is serialized with the module.
+        self.build_oob = True
+
     def _hold_uv_multiplier(self):
         """
         Save the current uv multipliers.
@@ -672,19 +793,16 @@ class AvarFollicle(AvarSimple):
         :return: A tuple containing two pymel.Attribute: the relative parameterU and relative parameterV.
         """
         # Apply custom multiplier
-        attr_u = libRigging.create_utility_node(
+        # Both parameters are resolved by the same node.
+        util_mult = libRigging.create_utility_node(
             'multiplyDivide',
             input1X=self.attr_lr,
-            input2X=self.attr_multiplier_lr
-        ).outputX
-
-        attr_v = libRigging.create_utility_node(
-            'multiplyDivide',
-            input1X=self.attr_ud,
-            input2X=self.attr_multiplier_ud
-        ).outputX
+            input2X=self.attr_multiplier_lr,
+            input1Y=self.attr_ud,
+            input2Y=self.attr_multiplier_ud
+        )
 
-        return attr_u, attr_v
+        return util_mult.outputX, util_mult.outputY
 
     def _get_follicle_absolute_uv_attr(self, mult_u=1.0, mult_v=1.0):
         """
@@ -700,17 +818,14 @@ class AvarFollicle(AvarSimple):
         attr_u_relative, attr_v_relative = self._get_follicle_relative_uv_attr(mult_u=mult_u, mult_v=mult_v)
 
         # Add base parameterU & parameterV
-        attr_u_cur = libRigging.create_utility_node(
-            'addDoubleLinear',
-            input1=self._attr_u_base,
-            input2=attr_u_relative
-        ).output
-
-        attr_v_cur = libRigging.create_utility_node(
-            'addDoubleLinear',
-            input1=self._attr_v_base,
-            input2=attr_v_relative
-        ).output
+        # Both parameters are resolved by the same node.
+        util_add = libRigging.create_utility_node('plusMinusAverage')
+        pymel.connectAttr(self._attr_u_base, util_add.input2D[0].input2Dx)
+        pymel.connectAttr(self._attr_v_base, util_add.input2D[0].input2Dy)
+        pymel.connectAttr(attr_u_relative, util_add.input2D[1].input2Dx)
+        pymel.connectAttr(attr_v_relative, util_add.input2D[1].input2Dy)
+        attr_u_cur = util_add.output2Dx
+        attr_v_cur = util_add.output2Dy
 
         # TODO: Move attribute connection outside of this function.
         pymel.connectAttr(attr_u_cur, attr_u_inn)
@@ -726,41 +841,21 @@ class AvarFollicle(AvarSimple):
         """
         # TODO: Maybe use sub-classing to differenciate when we need to use a surface or not.
         nomenclature_rig = self.get_nomenclature_rig()
+        names = dict((token, nomenclature_rig.resolve(token)) for token in (
+            'arcdimension', 'bindPoseFollicle', 'influenceFollicle', 'influenceClampedV', 'influenceClampedU'
+        ))
 
         #
         # Extract the base U and V of the base influence using the stack parent. (the 'offset' node)
         #
-        surface_shape = self.surface.getShape()
-
-        util_get_base_uv_absolute = libRigging.create_utility_node(
-            'closestPointOnSurface',
-            inPosition=self._grp_offset.t,
-            inputSurface=surface_shape.worldSpace
-        )
-
-        util_get_base_uv_normalized = libRigging.create_utility_node(
-            'setRange',
-            oldMinX=surface_shape.minValueU,
-            oldMaxX=surface_shape.maxValueU,
-            oldMinY=surface_shape.minValueV,
-            oldMaxY=surface_shape.maxValueV,
-            minX=0,
-            maxX=1,
-            minY=0,
-            maxY=1,
-            valueX=util_get_base_uv_absolute.parameterU,
-            valueY=util_get_base_uv_absolute.parameterV
+        # The offset node is only positioned at build time, so the base u and v are resolved once
+        # and stored as static values instead of being evaluated by a closestPointOnSurface node.
+        _, base_u_val, base_v_val = libRigging.get_closest_point_on_surface(
+            self.surface, self._grp_offset.getTranslation()
         )
-        attr_base_u_normalized = util_get_base_uv_normalized.outValueX
-        attr_base_v_normalized = util_get_base_uv_normalized.outValueY
-
-        self._attr_u_base = libAttr.addAttr(self.grp_rig, longName=self._ATTR_NAME_U_BASE,
-                                            defaultValue=attr_base_u_normalized.get())
-        self._attr_v_base = libAttr.addAttr(self.grp_rig, longName=self._ATTR_NAME_V_BASE,
-                                            defaultValue=attr_base_v_normalized.get())
 
-        pymel.connectAttr(attr_base_u_normalized, self.grp_rig.attr(self._ATTR_NAME_U_BASE))
-        pymel.connectAttr(attr_base_v_normalized, self.grp_rig.attr(self._ATTR_NAME_V_BASE))
+        self._attr_u_base = libAttr.addAttr(self.grp_rig, longName=self._ATTR_NAME_U_BASE, defaultValue=base_u_val)
+        self._attr_v_base = libAttr.addAttr(self.grp_rig, longName=self._ATTR_NAME_V_BASE, defaultValue=base_v_val)
 
         #
         # Create follicle setup
@@ -772,82 +867,65 @@ class AvarFollicle(AvarSimple):
         # Determine the follicle U and V on the reference nurbsSurface.
         # jnt_pos = self.jnt.getTranslation(space='world')
         # fol_pos, fol_u, fol_v = libRigging.get_closest_point_on_surface(self.surface, jnt_pos)
-        base_u_val = self._attr_u_base.get()
-        base_v_val = self._attr_v_base.get()
 
         # Resolve the length of each axis of the surface
-        self._attr_length_u, self._attr_length_v, arcdimension_shape = libRigging.create_arclengthdimension_for_nurbsplane(
-            self.surface)
-        arcdimension_transform = arcdimension_shape.getParent()
-        arcdimension_transform.rename(nomenclature_rig.resolve('arcdimension'))
-        arcdimension_transform.setParent(self.grp_rig)
+        # If we are part of an avar group, the measure is shared between all the avars using the same surface.
+        if self._parent_module:
+            self._attr_length_u, self._attr_length_v = self._parent_module.get_surface_length_attrs(self.surface)
+        else:
+            self._attr_length_u, self._attr_length_v, arcdimension_shape = libRigging.create_arclengthdimension_for_nurbsplane(
+                self.surface)
+            arcdimension_transform = arcdimension_shape.getParent()
+            arcdimension_transform.rename(names['arcdimension'])
+            arcdimension_transform.setParent(self.grp_rig)
 
         #
-        # Create two follicle.
+        # Create two reference.
         # - influenceFollicle: Affected by the ud and lr Avar
-        # - bindPoseFollicle: A follicle that stay in place and keep track of the original position.
-        # We'll then compute the delta of the position of the two follicles.
-        # This allow us to move or resize the plane without affecting the built rig. (if the rig is in neutral pose)
+        # - bindPoseFollicle: A temporary follicle that keep track of the original position.
+        # We'll then compute the delta of the position of the two.
+        # Since the bind pose never change after the build, it is sampled once and baked in the network.
         #
-        offset_name = nomenclature_rig.resolve('bindPoseRef')
-        obj_offset = pymel.createNode('transform', name=offset_name)
-        obj_offset.setParent(self._grp_offset)
-
-        fol_offset_name = nomenclature_rig.resolve('bindPoseFollicle')
-        # fol_offset = libRigging.create_follicle(obj_offset, self.surface, name=fol_offset_name)
-        fol_offset_shape = libRigging.create_follicle2(self.surface, u=base_u_val, v=base_v_val)
-        fol_offset = fol_offset_shape.getParent()
-        fol_offset.rename(fol_offset_name)
-        pymel.parentConstraint(fol_offset, obj_offset, maintainOffset=False)
-        fol_offset.setParent(self.grp_rig)
+        # Note: We use cmds to create the follicles since they are all identical at creation.
+        surface_shape = self.surface.getShape(noIntermediate=True).__melobject__()
+        grp_rig = self.grp_rig.__melobject__()
 
-        # Create the influence follicle
-        influence_name = nomenclature_rig.resolve('influenceRef')
-        influence = pymel.createNode('transform', name=influence_name)
-        influence.setParent(self._grp_offset)
+        fol_offset = _create_follicle(surface_shape, base_u_val, base_v_val, names['bindPoseFollicle'], grp_rig)
+        tm_bind = fol_offset.getMatrix(worldSpace=True)
+        pymel.delete(fol_offset)
 
-        fol_influence_name = nomenclature_rig.resolve('influenceFollicle')
-        fol_influence_shape = libRigging.create_follicle2(self.surface, u=base_u_val, v=base_v_val)
-        fol_influence = fol_influence_shape.getParent()
-        fol_influence.rename(fol_influence_name)
-        pymel.parentConstraint(fol_influence, influence, maintainOffset=False)
-        fol_influence.setParent(self.grp_rig)
+        # Create the influence follicle
+        # Note that we use the follicle world matrix directly instead of constraining a reference transform to it.
+        fol_influence = _create_follicle(surface_shape, base_u_val, base_v_val, names['influenceFollicle'], grp_rig)
 
         #
         # Extract the delta of the influence follicle and it's initial pose follicle
         #
-        attr_localTM = libRigging.create_utility_node('multMatrix', matrixIn=[
-            influence.worldMatrix,
-            obj_offset.worldInverseMatrix
-        ]).matrixSum
-
         # Since we are extracting the delta between the influence and the bindpose matrix, the rotation of the surface
         # is not taken in consideration wich make things less intuitive for the rigger.
         # So we'll add an adjustement matrix so the rotation of the surface is taken in consideration.
-        util_decomposeTM_bindPose = libRigging.create_utility_node('decomposeMatrix',
-                                                                   inputMatrix=obj_offset.worldMatrix
-                                                                   )
-        attr_translateTM = libRigging.create_utility_node('composeMatrix',
-                                                          inputTranslate=util_decomposeTM_bindPose.outputTranslate
-                                                          ).outputMatrix
-        attr_translateTM_inv = libRigging.create_utility_node('inverseMatrix',
-                                                              inputMatrix=attr_translateTM,
-                                                              ).outputMatrix
-        attr_rotateTM = libRigging.create_utility_node('multMatrix',
-                                                       matrixIn=[obj_offset.worldMatrix, attr_translateTM_inv]
-                                                       ).matrixSum
-        attr_rotateTM_inv = libRigging.create_utility_node('inverseMatrix',
-                                                           inputMatrix=attr_rotateTM
-                                                           ).outputMatrix
-        attr_finalTM = libRigging.create_utility_node('multMatrix',
-                                                      matrixIn=[attr_rotateTM_inv,
-                                                                attr_localTM,
-                                                                attr_rotateTM]
-                                                      ).matrixSum
-
-        util_decomposeTM = libRigging.create_utility_node('decomposeMatrix',
-                                                          inputMatrix=attr_finalTM
-                                                          )
+        # The adjustement matrix is the bindpose matrix without it's translation.
+        # Since the bindpose is constant, everything except the influence follicle is resolved at build time.
+        pos_bind = tm_bind.translate
+        tm_bind_translate = pymel.datatypes.Matrix(
+            1, 0, 0, 0,
+            0, 1, 0, 0,
+            0, 0, 1, 0,
+            pos_bind.x, pos_bind.y, pos_bind.z, 1
+        )
+        tm_bind_inv = tm_bind.inverse()
+        tm_rotate = tm_bind * tm_bind_translate.inverse()
+
+        # The local delta and the adjustement are resolved by the same node.
+        attr_finalTM = libRigging.create_utility_node_fast('multMatrix',
+                                                           matrixIn=[tm_bind_translate * tm_bind_inv,
+                                                                     fol_influence.worldMatrix,
+                                                                     tm_bind_inv * tm_rotate]
+                                                           ) + '.matrixSum'
+
+        util_decomposeTM = libRigging.create_utility_node_fast('decomposeMatrix',
+                                                               inputMatrix=attr_finalTM
+                                                               )
 
         #
         # Resolve the parameterU and parameterV
@@ -865,185 +943,134 @@ class AvarFollicle(AvarSimple):
         # Create the 1st (follicleLayer) that will contain the extracted position from the ud and lr Avar.
         #
         layer_follicle = stack.append_layer('follicleLayer')
-        pymel.connectAttr(util_decomposeTM.outputTranslate, layer_follicle.translate)
-
-        pymel.connectAttr(attr_u_inn, fol_influence.parameterU)
-        pymel.connectAttr(attr_v_inn, fol_influence.parameterV)
-        pymel.connectAttr(self._attr_u_base, fol_offset.parameterU)
-        pymel.connectAttr(self._attr_v_base, fol_offset.parameterV)
+        _connect_attrs((
+            (util_decomposeTM + '.outputTranslate', layer_follicle.translate),
+            (attr_u_inn, fol_influence.parameterU),
+            (attr_v_inn, fol_influence.parameterV),
+        ))
 
         #
         # The second layer (oobLayer for out-of-bound) that allow the follicle to go outside it's original plane.
         # If the UD value is out the nurbsPlane UV range (0-1), ie 1.1, we'll want to still offset the follicle.
         # For that we'll compute a delta between a small increment (0.99 and 1.0) and multiply it.
         #
-        nomenclature_rig = self.get_nomenclature_rig()
-        oob_step_size = 0.001  # TODO: Expose a Maya attribute?
-
-        fol_clamped_v_name = nomenclature_rig.resolve('influenceClampedV')
-        fol_clamped_v_shape = libRigging.create_follicle2(self.surface, u=base_u_val, v=base_v_val)
-        fol_clamped_v = fol_clamped_v_shape.getParent()
-        fol_clamped_v.rename(fol_clamped_v_name)
-        fol_clamped_v.setParent(self.grp_rig)
-
-        fol_clamped_u_name = nomenclature_rig.resolve('influenceClampedU')
-        fol_clamped_u_shape = libRigging.create_follicle2(self.surface, u=base_u_val, v=base_v_val)
-        fol_clamped_u = fol_clamped_u_shape.getParent()
-        fol_clamped_u.rename(fol_clamped_u_name)
-        fol_clamped_u.setParent(self.grp_rig)
-
-        # Clamp the values so they never fully reach 0 or 1 for U and V.
-        util_clamp_uv = libRigging.create_utility_node('clamp',
-                                                       inputR=attr_u_inn,
-                                                       inputG=attr_v_inn,
-                                                       minR=oob_step_size,
-                                                       minG=oob_step_size,
-                                                       maxR=1.0 - oob_step_size,
-                                                       maxG=1.0 - oob_step_size)
-        clamped_u = util_clamp_uv.outputR
-        clamped_v = util_clamp_uv.outputG
-
-        pymel.connectAttr(clamped_v, fol_clamped_v.parameterV)
-        pymel.connectAttr(attr_u_inn, fol_clamped_v.parameterU)
-
-        pymel.connectAttr(attr_v_inn, fol_clamped_u.parameterV)
-        pymel.connectAttr(clamped_u, fol_clamped_u.parameterU)
-
-        # Compute the direction to add for U and V if we are out-of-bound.
-        dir_oob_u = libRigging.create_utility_node('plusMinusAverage',
-                                                   operation=2,
-                                                   input3D=[
-                                                       fol_influence.translate,
-                                                       fol_clamped_u.translate
-                                                   ]).output3D
-        dir_oob_v = libRigging.create_utility_node('plusMinusAverage',
-                                                   operation=2,
-                                                   input3D=[
-                                                       fol_influence.translate,
-                                                       fol_clamped_v.translate
-                                                   ]).output3D
-
-        # Compute the offset to add for U and V
-
-        condition_oob_u_neg = libRigging.create_utility_node('condition',
-                                                             operation=4,  # less than
-                                                             firstTerm=attr_u_inn,
-                                                             secondTerm=0.0,
-                                                             colorIfTrueR=1.0,
-                                                             colorIfFalseR=0.0,
-                                                             ).outColorR
-        condition_oob_u_pos = libRigging.create_utility_node('condition',  # greater than
-                                                             operation=2,
-                                                             firstTerm=attr_u_inn,
-                                                             secondTerm=1.0,
-                                                             colorIfTrueR=1.0,
-                                                             colorIfFalseR=0.0,
-                                                             ).outColorR
-        condition_oob_v_neg = libRigging.create_utility_node('condition',
-                                                             operation=4,  # less than
-                                                             firstTerm=attr_v_inn,
-                                                             secondTerm=0.0,
-                                                             colorIfTrueR=1.0,
-                                                             colorIfFalseR=0.0,
-                                                             ).outColorR
-        condition_oob_v_pos = libRigging.create_utility_node('condition',  # greater than
-                                                             operation=2,
-                                                             firstTerm=attr_v_inn,
-                                                             secondTerm=1.0,
-                                                             colorIfTrueR=1.0,
-                                                             colorIfFalseR=0.0,
-                                                             ).outColorR
-
-        # Compute the amount of oob
-        oob_val_u_pos = libRigging.create_utility_node('plusMinusAverage', operation=2,
-                                                       input1D=[attr_u_inn, 1.0]).output1D
-        oob_val_u_neg = libRigging.create_utility_node('multiplyDivide', input1X=attr_u_inn, input2X=-1.0).outputX
-        oob_val_v_pos = libRigging.create_utility_node('plusMinusAverage', operation=2,
-                                                       input1D=[attr_v_inn, 1.0]).output1D
-        oob_val_v_neg = libRigging.create_utility_node('multiplyDivide', input1X=attr_v_inn, input2X=-1.0).outputX
-        oob_val_u = libRigging.create_utility_node('condition', operation=0, firstTerm=condition_oob_u_pos,
-                                                   secondTerm=1.0, colorIfTrueR=oob_val_u_pos,
-                                                   colorIfFalseR=oob_val_u_neg).outColorR
-        oob_val_v = libRigging.create_utility_node('condition', operation=0, firstTerm=condition_oob_v_pos,
-                                                   secondTerm=1.0, colorIfTrueR=oob_val_v_pos,
-                                                   colorIfFalseR=oob_val_v_neg).outColorR
-
-        oob_amount_u = libRigging.create_utility_node('multiplyDivide', operation=2, input1X=oob_val_u,
-                                                      input2X=oob_step_size).outputX
-        oob_amount_v = libRigging.create_utility_node('multiplyDivide', operation=2, input1X=oob_val_v,
-                                                      input2X=oob_step_size).outputX
-
-        oob_offset_u = libRigging.create_utility_node('multiplyDivide', input1X=oob_amount_u, input1Y=oob_amount_u,
-                                                      input1Z=oob_amount_u, input2=dir_oob_u).output
-        oob_offset_v = libRigging.create_utility_node('multiplyDivide', input1X=oob_amount_v, input1Y=oob_amount_v,
-                                                      input1Z=oob_amount_v, input2=dir_oob_v).output
-
-        # Add the U out-of-bound-offset only if the U is between 0.0 and 1.0
-        oob_u_condition_1 = condition_oob_u_neg
-        oob_u_condition_2 = condition_oob_u_pos
-        oob_u_condition_added = libRigging.create_utility_node('addDoubleLinear',
-                                                               input1=oob_u_condition_1,
-                                                               input2=oob_u_condition_2
-                                                               ).output
-        oob_u_condition_out = libRigging.create_utility_node('condition',
-                                                             operation=0,  # equal
-                                                             firstTerm=oob_u_condition_added,
-                                                             secondTerm=1.0,
-                                                             colorIfTrue=oob_offset_u,
-                                                             colorIfFalse=[0, 0, 0]
-                                                             ).outColor
-
-        # Add the V out-of-bound-offset only if the V is between 0.0 and 1.0
-        oob_v_condition_1 = condition_oob_v_neg
-        oob_v_condition_2 = condition_oob_v_pos
-        oob_v_condition_added = libRigging.create_utility_node('addDoubleLinear',
-                                                               input1=oob_v_condition_1,
-                                                               input2=oob_v_condition_2
-                                                               ).output
-        oob_v_condition_out = libRigging.create_utility_node('condition',
-                                                             operation=0,  # equal
-                                                             firstTerm=oob_v_condition_added,
-                                                             secondTerm=1.0,
-                                                             colorIfTrue=oob_offset_v,
-                                                             colorIfFalse=[0, 0, 0]
-                                                             ).outColor
-
-        oob_offset = libRigging.create_utility_node('plusMinusAverage',
-                                                    input3D=[oob_u_condition_out, oob_v_condition_out]).output3D
+        # Avars that never leave the [0, 1] range can skip the whole out-of-bound network.
+        # The oobLayer is still created so the stack hierarchy stay the same.
+        oob_offset = None
+        if self.build_oob:
+            oob_step_size = 0.001  # TODO: Expose a Maya attribute?
+
+            fol_clamped_v = _create_follicle(surface_shape, base_u_val, base_v_val, names['influenceClampedV'], grp_rig)
+            fol_clamped_u = _create_follicle(surface_shape, base_u_val, base_v_val, names['influenceClampedU'], grp_rig)
+
+            # Clamp the values so they never fully reach 0 or 1 for U and V.
+            util_clamp_uv = libRigging.create_utility_node_fast('clamp',
+                                                                inputR=attr_u_inn,
+                                                                inputG=attr_v_inn,
+                                                                minR=oob_step_size,
+                                                                minG=oob_step_size,
+                                                                maxR=1.0 - oob_step_size,
+                                                                maxG=1.0 - oob_step_size)
+            clamped_u = util_clamp_uv + '.outputR'
+            clamped_v = util_clamp_uv + '.outputG'
+
+            _connect_attrs((
+                (clamped_v, fol_clamped_v.parameterV),
+                (attr_u_inn, fol_clamped_v.parameterU),
+                (attr_v_inn, fol_clamped_u.parameterV),
+                (clamped_u, fol_clamped_u.parameterU),
+            ))
+
+            # Compute the direction to add for U and V if we are out-of-bound.
+            dir_oob_u = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                            operation=2,
+                                                            input3D=[
+                                                                fol_influence.translate,
+                                                                fol_clamped_u.translate
+                                                            ]) + '.output3D'
+            dir_oob_v = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                            operation=2,
+                                                            input3D=[
+                                                                fol_influence.translate,
+                                                                fol_clamped_v.translate
+                                                            ]) + '.output3D'
+
+            # Compute the amount of oob for U and V, this is zero while the value is between 0.0 and 1.0.
+            # The amount is the absolute distance to the nearest bound, it's direction is already carried by dir_oob_u/v.
+            util_clamp_uv_bounds = libRigging.create_utility_node_fast('clamp',
+                                                                       inputR=attr_u_inn,
+                                                                       inputG=attr_v_inn,
+                                                                       maxR=1.0,
+                                                                       maxG=1.0)
+            util_oob_val = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                               operation=2,
+                                                               input2D=[
+                                                                   (attr_u_inn, attr_v_inn),
+                                                                   (util_clamp_uv_bounds + '.outputR',
+                                                                    util_clamp_uv_bounds + '.outputG')
+                                                               ])
+
+            util_oob_steps = libRigging.create_utility_node_fast('multiplyDivide', operation=2,
+                                                                 input1X=util_oob_val + '.output2Dx',
+                                                                 input1Y=util_oob_val + '.output2Dy',
+                                                                 input2X=oob_step_size,
+                                                                 input2Y=oob_step_size)
+            util_oob_steps_squared = libRigging.create_utility_node_fast('multiplyDivide', operation=3,  # power
+                                                                         input1=util_oob_steps + '.output',
+                                                                         input2X=2.0,
+                                                                         input2Y=2.0)
+            util_oob_amount = libRigging.create_utility_node_fast('multiplyDivide', operation=3,  # power
+                                                                  input1=util_oob_steps_squared + '.output',
+                                                                  input2X=0.5,
+                                                                  input2Y=0.5)
+            oob_amount_u = util_oob_amount + '.outputX'
+            oob_amount_v = util_oob_amount + '.outputY'
+
+            # Compute the offset to add for U and V
+            oob_offset_u = libRigging.create_utility_node_fast('multiplyDivide', input1X=oob_amount_u, input1Y=oob_amount_u,
+                                                               input1Z=oob_amount_u, input2=dir_oob_u) + '.output'
+            oob_offset_v = libRigging.create_utility_node_fast('multiplyDivide', input1X=oob_amount_v, input1Y=oob_amount_v,
+                                                               input1Z=oob_amount_v, input2=dir_oob_v) + '.output'
+
+            oob_offset = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                             input3D=[oob_offset_u, oob_offset_v]) + '.output3D'
 
         layer_oob = stack.append_layer('oobLayer')
-        pymel.connectAttr(oob_offset, layer_oob.t)
+        if oob_offset:
+            _connect_attrs(((oob_offset, layer_oob.t),))
 
         #
         # Create the third layer that apply the translation provided by the fb Avar.
         #
 
         layer_fb = stack.append_layer('fbLayer')
-        attr_get_fb = libRigging.create_utility_node('multiplyDivide',
-                                                     input1X=self.attr_fb,
-                                                     input2X=self._attr_length_u).outputX
-        attr_get_fb_adjusted = libRigging.create_utility_node('multiplyDivide',
-                                                              input1X=attr_get_fb,
-                                                              input2X=self.attr_multiplier_fb).outputX
-        pymel.connectAttr(attr_get_fb_adjusted, layer_fb.translateZ)
+        attr_get_fb = libRigging.create_utility_node_fast('multiplyDivide',
+                                                          input1X=self.attr_fb,
+                                                          input2X=self._attr_length_u) + '.outputX'
+        attr_get_fb_adjusted = libRigging.create_utility_node_fast('multiplyDivide',
+                                                                   input1X=attr_get_fb,
+                                                                   input2X=self.attr_multiplier_fb) + '.outputX'
+        _connect_attrs(((attr_get_fb_adjusted, layer_fb.translateZ),))
 
         #
         # Create the 4th layer (folRot) that apply the rotation provided by the follicle controlled by the ud and lr Avar.
         # This is necessary since we don't want to rotation to affect the oobLayer and fbLayer.
         #
         layer_follicle_rot = stack.append_layer('folRot')
-        pymel.connectAttr(util_decomposeTM.outputRotate, layer_follicle_rot.rotate)
+        _connect_attrs(((util_decomposeTM + '.outputRotate', layer_follicle_rot.rotate),))
 
         #
         # Create a 5th layer that apply the avar rotation and scale..
         #
         layer_rot = stack.append_layer('rotLayer')
-        pymel.connectAttr(self.attr_yw, layer_rot.rotateY)
-        pymel.connectAttr(self.attr_pt, layer_rot.rotateX)
-        pymel.connectAttr(self.attr_rl, layer_rot.rotateZ)
-        pymel.connectAttr(self.attr_sx, layer_rot.scaleX)
-        pymel.connectAttr(self.attr_sy, layer_rot.scaleY)
-        pymel.connectAttr(self.attr_sz, layer_rot.scaleZ)
+        _connect_attrs((
+            (self.attr_yw, layer_rot.rotateY),
+            (self.attr_pt, layer_rot.rotateX),
+            (self.attr_rl, layer_rot.rotateZ),
+            (self.attr_sx, layer_rot.scaleX),
+            (self.attr_sy, layer_rot.scaleY),
+            (self.attr_sz, layer_rot.scaleZ),
+        ))
 
         return stack
 
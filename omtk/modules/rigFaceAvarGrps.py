@@ -639,6 +639,20 @@ class AvarGrp(
             self.warning("Can't find surface for {0}, creating one...".format(self))
             self.surface = self.create_surface()
 
+    @libPython.memoized_instancemethod
+    def get_surface_length_attrs(self, surface):
+        """
+        Resolve the length of each axis of a surface.
+        The arcLengthDimension is shared by all the avars sliding on the same surface.
+        :param surface: The pymel.nodetypes.NurbsSurface or it's transform.
+        :return: The u and v length attributes.
+        """
+        attr_length_u, attr_length_v, arcdimension_shape = libRigging.create_arclengthdimension_for_nurbsplane(surface)
+        arcdimension_transform = arcdimension_shape.getParent()
+        arcdimension_transform.rename(self.get_nomenclature_rig().resolve('arcdimension'))
+        arcdimension_transform.setParent(self.grp_rig)
+        return attr_length_u, attr_length_v
+
     def build(self, connect_global_scale=None, create_ctrls=True, parent=True, constraint=True,
               create_grp_rig_macro=True, create_grp_rig_micro=True, create_grp_anm_macro=True,
               create_grp_anm_micro=True, calibrate=True, **kwargs):
@@ -1,17 +1,27 @@
-import functools
+import math
 import collections
 from pymel.util.enum import Enum
 import pymel.core as pymel
+from maya import cmds
 from omtk import constants
 from omtk.core.classCtrl import BaseCtrl
 from omtk.core.classModule import Module
 from omtk.core.classNode import Node
 from omtk.libs import libRigging
-from omtk.libs import libAttr
-from omtk.libs import libFormula
 from omtk.libs import libPymel
 
 
+def _create_division(attr_a, attr_b):
+    """
+    :param attr_a: The dividend plug name.
+    :param attr_b: The divisor plug name.
+    :return: The plug name of the quotient.
+    """
+    util = libRigging.create_utility_node_fast('multiplyDivide', input1X=attr_a, input2X=attr_b)
+    cmds.setAttr(util + '.operation', 2)  # HACK: Prevent division by zero by changing the operator at the last second.
+    return util + '.outputX'
+
+
 def _get_vector_from_axis(axis):
     if axis == constants.Axis.x:
         return pymel.datatypes.Vector.xAxis
@@ -141,22 +151,44 @@ class SoftIkNode(Node):
         :return: Nothing
         """
         super(SoftIkNode, self).build(**kwargs)
-        formula = libFormula.Formula()
-        fn_add_attr = functools.partial(libAttr.addAttr, self.node, hasMinValue=True, hasMaxValue=True)
-        formula.inMatrixS = fn_add_attr(longName='inMatrixS', dt='matrix')
-        formula.inMatrixE = fn_add_attr(longName='inMatrixE', dt='matrix')
-        formula.inRatio = fn_add_attr(longName='inRatio', at='float')
-        formula.inStretch = fn_add_attr(longName='inStretch', at='float')
-        formula.inChainLength = fn_add_attr(longName='inChainLength', at='float', defaultValue=1.0)
-
+        node = self.node.__melobject__()
+
+        for attr_name, attr_kwargs in (
+                ('inMatrixS', {'dt': 'matrix'}),
+                ('inMatrixE', {'dt': 'matrix'}),
+                ('inRatio', {'at': 'float'}),
+                ('inStretch', {'at': 'float'}),
+                ('inChainLength', {'at': 'float', 'defaultValue': 1.0}),
+                ('outRatio', {'at': 'float'}),
+                ('outRatioInv', {'at': 'float'}),
+                ('outStretch', {'at': 'float'}),
+        ):
+            cmds.addAttr(node, longName=attr_name, hasMinValue=True, hasMaxValue=True, **attr_kwargs)
+
+        attr_inn_matrix_s = node + '.inMatrixS'
+        attr_inn_matrix_e = node + '.inMatrixE'
+        attr_inn_ratio = node + '.inRatio'
+        attr_inn_stretch = node + '.inStretch'
+        attr_inn_chain_length = node + '.inChainLength'
+
+        # Note: The network is created explicitly since the formulas never change.
         # inDistance is the distance between the start of the chain and the ikCtrl
-        formula.inDistance = "inMatrixS~inMatrixE"
+        attr_distance = libRigging.create_utility_node_fast('distanceBetween',
+                                                            inMatrix1=attr_inn_matrix_s,
+                                                            inMatrix2=attr_inn_matrix_e
+                                                            ) + '.distance'
         # distanceSoft is the distance before distanceMax where the softIK kick in.
         # ex: For a chain of length 10.0 with a ratio of 0.1, the distanceSoft will be 1.0.
-        formula.distanceSoft = "inChainLength*inRatio"
+        attr_distance_soft = libRigging.create_utility_node_fast('multiplyDivide',
+                                                                 input1X=attr_inn_chain_length,
+                                                                 input2X=attr_inn_ratio
+                                                                 ) + '.outputX'
         # distanceSafe is the distance where there's no softIK.
         # ex: For a chain of length 10.0 with a ratio of 0.1, the distanceSafe will be 9.0.
-        formula.distanceSafe = "inChainLength-distanceSoft"
+        attr_distance_safe = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                                 operation=2,
+                                                                 input1D=[attr_inn_chain_length, attr_distance_soft]
+                                                                 ) + '.output1D'
         # This represent the soft-ik state
         # When the soft-ik kick in, the value is 0.0.
         # When the stretch kick in, the value is 1.0.
@@ -166,64 +198,97 @@ class SoftIkNode(Node):
         # Hack: Prevent potential division by zero.
         # Originally we were using a condition, however in Maya 2016+ in Parallel or Serial evaluation mode, this
         # somehow evalated the division even when the condition was False.
-        formula.distanceSoftClamped = libRigging.create_utility_node('clamp',
-                                                                     inputR=formula.distanceSoft,
-                                                                     minR=0.0001,
-                                                                     maxR=999
-                                                                     ).outputR
-        formula.deltaSafeSoft = "(inDistance-distanceSafe)/distanceSoftClamped"
+        attr_distance_soft_clamped = libRigging.create_utility_node_fast('clamp',
+                                                                         inputR=attr_distance_soft,
+                                                                         minR=0.0001,
+                                                                         maxR=999
+                                                                         ) + '.outputR'
+        attr_delta_safe = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                              operation=2,
+                                                              input1D=[attr_distance, attr_distance_safe]
+                                                              ) + '.output1D'
+        attr_delta_safe_soft = _create_division(attr_delta_safe, attr_distance_soft_clamped)
 
         # outDistanceSoft is the desired ikEffector distance from the chain start after aplying the soft-ik
         # If there's no stretch, this will be directly applied to the ikEffector.
         # If there's stretch, this will be used to compute the amount of stretch needed to reach the ikCtrl
         # while preserving the shape.
-        formula.outDistanceSoft = "(distanceSoft*(1-(e^(deltaSafeSoft*-1))))+distanceSafe"
-
-        # Affect ikEffector distance only where inDistance if bigger than distanceSafe.
-        formula.outDistance = libRigging.create_utility_node('condition',
-                                                             operation=2,
-                                                             firstTerm=formula.deltaSafeSoft,
-                                                             secondTerm=0.0,
-                                                             colorIfTrueR=formula.outDistanceSoft,
-                                                             colorIfFalseR=formula.inDistance
-                                                             ).outColorR
-        # Affect ikEffector when we're not using stretching
-        formula.outDistance = libRigging.create_utility_node('blendTwoAttr',
-                                                             input=[formula.outDistance, formula.inDistance],
-                                                             attributesBlender=formula.inStretch).output
-
-        #
-        # Handle Stretching
-        #
+        # outDistanceSoft = (distanceSoft * (1 - (e ^ (deltaSafeSoft * -1)))) + distanceSafe
+        attr_delta_safe_soft_inv = libRigging.create_utility_node_fast('multiplyDivide',
+                                                                       input1X=attr_delta_safe_soft,
+                                                                       input2X=-1
+                                                                       ) + '.outputX'
+        attr_exp = libRigging.create_utility_node_fast('multiplyDivide',
+                                                       operation=3,  # power
+                                                       input1X=math.e,
+                                                       input2X=attr_delta_safe_soft_inv
+                                                       ) + '.outputX'
+        attr_exp_inv = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                           operation=2,
+                                                           input1D=[1.0, attr_exp]
+                                                           ) + '.output1D'
+        attr_distance_soft_falloff = libRigging.create_utility_node_fast('multiplyDivide',
+                                                                         input1X=attr_distance_soft,
+                                                                         input2X=attr_exp_inv
+                                                                         ) + '.outputX'
+        attr_out_distance_soft = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                                     operation=1,
+                                                                     input1D=[attr_distance_soft_falloff,
+                                                                              attr_distance_safe]
+                                                                     ) + '.output1D'
+
+        # The soft-ik ratio is the part of the distance the ikEffector will reach.
+        # Its inverse is also resolved here so the ikHandle constraint weights don't need their own node.
+        attr_distance_remaining = libRigging.create_utility_node_fast('plusMinusAverage',
+                                                                      operation=2,
+                                                                      input1D=[attr_distance, attr_out_distance_soft]
+                                                                      ) + '.output1D'
 
         # If we're using softIk AND stretchIk, we'll use the outRatioSoft to stretch the joints enough so
         # that the ikEffector reach the ikCtrl.
-        formula.outStretch = "inDistance/outDistanceSoft"
-
-        # Apply the softIK only AFTER the distanceSafe
-        formula.outStretch = libRigging.create_utility_node('condition',
-                                                            operation=2,
-                                                            firstTerm=formula.inDistance,
-                                                            secondTerm=formula.distanceSafe,
-                                                            colorIfTrueR=formula.outStretch,
-                                                            colorIfFalseR=1.0
-                                                            ).outColorR
-
-        # Apply stretching only if inStretch is ON
-        formula.outStretch = libRigging.create_utility_node('blendTwoAttr',
-                                                            input=[1.0, formula.outStretch],
-                                                            attributesBlender=formula.inStretch).output
+        # The ratio (X), the stretch (Y) and the inverse ratio (Z) are resolved by the same node.
+        # Note: The lanes order match the condition channels below (R, G, B).
+        util_division = libRigging.create_utility_node_fast('multiplyDivide',
+                                                            input1X=attr_out_distance_soft,
+                                                            input2X=attr_distance,
+                                                            input1Y=attr_distance,
+                                                            input2Y=attr_out_distance_soft,
+                                                            input1Z=attr_distance_remaining,
+                                                            input2Z=attr_distance)
+        # HACK: Prevent division by zero by changing the operator at the last second.
+        cmds.setAttr(util_division + '.operation', 2)
+
+        # Affect the ikEffector distance and the stretch only where inDistance is bigger than distanceSafe.
+        # Note: Since distanceSoftClamped is always positive, this is the same as deltaSafeSoft being positive.
+        # All the values share the same condition node, ratio in R, stretch in G and inverse ratio in B.
+        util_condition = libRigging.create_utility_node_fast('condition',
+                                                             operation=2,
+                                                             firstTerm=attr_distance,
+                                                             secondTerm=attr_distance_safe,
+                                                             colorIfTrue=util_division + '.output',
+                                                             colorIfFalseR=1.0,
+                                                             colorIfFalseG=1.0,
+                                                             colorIfFalseB=0.0
+                                                             )
+
+        # Affect ikEffector when we're not using stretching and apply stretching only if inStretch is ON.
+        # All the blends are resolved by the same node.
+        util_blend = libRigging.create_utility_node_fast('blendColors',
+                                                         blender=attr_inn_stretch,
+                                                         color1R=1.0,
+                                                         color2R=util_condition + '.outColorR',
+                                                         color1G=util_condition + '.outColorG',
+                                                         color2G=1.0,
+                                                         color1B=0.0,
+                                                         color2B=util_condition + '.outColorB'
+                                                         )
 
         #
-        # Connect outRatio and outStretch to our softIkNode
+        # Connect outRatio, outRatioInv and outStretch to our softIkNode
         #
-        # fnAddAttr(longName='outTranslation', dt='float3')
-        formula.outRatio = "outDistance/inDistance"
-        attr_ratio = fn_add_attr(longName='outRatio', at='float')
-        pymel.connectAttr(formula.outRatio, attr_ratio)
-
-        attr_stretch = fn_add_attr(longName='outStretch', at='float')
-        pymel.connectAttr(formula.outStretch, attr_stretch)
+        cmds.connectAttr(util_blend + '.outputR', node + '.outRatio')
+        cmds.connectAttr(util_blend + '.outputG', node + '.outStretch')
+        cmds.connectAttr(util_blend + '.outputB', node + '.outRatioInv')
 
 
 # Todo: Support more complex IK limbs (ex: 2 knees)
@@ -263,16 +328,19 @@ class IK(Module):
         :param end_index: The end index of the _ik_chain that will be used to compute the swivel pos
         :return: The swivel position computed between the start and end
         """
-        pos_start = self.chain_jnt[start_index].getTranslation(space='world')
-        pos_end = self.chain_jnt[end_index].getTranslation(space='world')
+        # Note: The world and local translations are read in two batched api queries, no joint PyNode is queried.
+        jnts = self.chain_jnt[start_index:end_index + 1]
+        positions = libPymel.get_world_translations(jnts)
+        pos_start = positions[0]
+        pos_mid = positions[1]
+        pos_end = positions[-1]
+        lengths = [pos.length() for pos in libPymel.get_local_translations(jnts[1:])]
 
-        chain_length = 0
-        for i in range(start_index, end_index):
-            chain_length += self.chain_jnt[i + 1].t.get().length()
+        chain_length = sum(lengths)
 
-        ratio = self.chain_jnt[start_index + 1].t.get().length() / chain_length
+        ratio = lengths[0] / chain_length
         pos_swivel_base = (pos_end - pos_start) * ratio + pos_start
-        dir_swivel = (self.chain_jnt[start_index + 1].getTranslation(space='world') - pos_swivel_base).normal()
+        dir_swivel = (pos_mid - pos_swivel_base).normal()
         return pos_swivel_base + (dir_swivel * chain_length)
 
     def setup_softik(self, ik_handle_to_constraint, stretch_chains):
@@ -284,14 +352,16 @@ class IK(Module):
         """
         nomenclature_rig = self.get_nomenclature_rig()
 
-        oAttHolder = self.ctrl_ik
-        fnAddAttr = functools.partial(libAttr.addAttr, hasMinValue=True, hasMaxValue=True)
-        attInRatio = fnAddAttr(oAttHolder, longName='softIkRatio', niceName='SoftIK', defaultValue=0, minValue=0,
-                               maxValue=50, k=True)
-        attInStretch = fnAddAttr(oAttHolder, longName='stretch', niceName='Stretch', defaultValue=0, minValue=0,
-                                 maxValue=1.0, k=True)
+        oAttHolder = self.ctrl_ik.node
+        att_holder = oAttHolder.__melobject__()
+        for attr_name, nice_name, max_value in (('softIkRatio', 'SoftIK', 50), ('stretch', 'Stretch', 1.0)):
+            cmds.addAttr(att_holder, longName=attr_name, niceName=nice_name, defaultValue=0,
+                         hasMinValue=True, minValue=0, hasMaxValue=True, maxValue=max_value, k=True)
+        attInStretch = att_holder + '.stretch'
         # Adjust the ratio in percentage so animators understand that 0.03 is 3%
-        attInRatio = libRigging.create_utility_node('multiplyDivide', input1X=attInRatio, input2X=0.01).outputX
+        attInRatio = libRigging.create_utility_node_fast('multiplyDivide',
+                                                         input1X=att_holder + '.softIkRatio',
+                                                         input2X=0.01) + '.outputX'
 
         # Create and configure SoftIK solver
         soft_ik_network_name = nomenclature_rig.resolve('softik')
@@ -299,39 +369,52 @@ class IK(Module):
         soft_ik_network.build(name=soft_ik_network_name)
         soft_ik_network.setParent(self.grp_rig)
 
-        pymel.connectAttr(attInRatio, soft_ik_network.inRatio)
-        pymel.connectAttr(attInStretch, soft_ik_network.inStretch)
-        pymel.connectAttr(self._ikChainGrp.worldMatrix, soft_ik_network.inMatrixS)
-        pymel.connectAttr(self._ik_handle_target.worldMatrix, soft_ik_network.inMatrixE)
-        attr_distance = libFormula.parse('distance*globalScale',
-                                         distance=self.chain_length,
-                                         globalScale=self.grp_rig.globalScale)
-        pymel.connectAttr(attr_distance, soft_ik_network.inChainLength)
-
-        attOutRatio = soft_ik_network.outRatio
-        attOutRatioInv = libRigging.create_utility_node('reverse', inputX=soft_ik_network.outRatio).outputX
+        soft_ik_network_node = soft_ik_network.node.__melobject__()
+        attr_distance = libRigging.create_utility_node_fast('multiplyDivide',
+                                                            input1X=self.chain_length,
+                                                            input2X=self.grp_rig.globalScale
+                                                            ) + '.outputX'
+        for attr_src, attr_name in (
+                (attInRatio, 'inRatio'),
+                (attInStretch, 'inStretch'),
+                (self._ikChainGrp.__melobject__() + '.worldMatrix', 'inMatrixS'),
+                (self._ik_handle_target.__melobject__() + '.worldMatrix', 'inMatrixE'),
+                (attr_distance, 'inChainLength'),
+        ):
+            cmds.connectAttr(attr_src, '{0}.{1}'.format(soft_ik_network_node, attr_name))
+
+        attOutRatio = soft_ik_network_node + '.outRatio'
+        attOutRatioInv = soft_ik_network_node + '.outRatioInv'
         # TODO: Improve softik ratio when using multiple ik handle. Not the same ratio will be used depending of the angle
         for handle in ik_handle_to_constraint:
             pointConstraint = pymel.pointConstraint(self._ik_handle_target, self._ikChainGrp, handle)
             pointConstraint.rename(pointConstraint.stripNamespace().replace('pointConstraint', 'softIkConstraint'))
             weight_inn, weight_out = pointConstraint.getWeightAliasList()[-2:]  # Ensure to get the latest target added
-            pymel.connectAttr(attOutRatio, weight_inn)
-            pymel.connectAttr(attOutRatioInv, weight_out)
+            cmds.connectAttr(attOutRatio, weight_inn.__melobject__())
+            cmds.connectAttr(attOutRatioInv, weight_out.__melobject__())
 
         # Connect stretch
+        # Each joint translate is it's rest translate multiplied by the same stretch value.
+        # The non-zero components of all the joints are packed three at a time in multiplyDivide nodes.
+        # Zero components stay zero when stretched so they are not connected.
+        attr_out_stretch = soft_ik_network_node + '.outStretch'
+        stretch_plugs = []
         for stretch_chain in stretch_chains:
             for i in range(1, self.iCtrlIndex + 1):
-                obj = stretch_chain[i]
-                util_get_t = libRigging.create_utility_node(
-                    'multiplyDivide',
-                    input1X=soft_ik_network.outStretch,
-                    input1Y=soft_ik_network.outStretch,
-                    input1Z=soft_ik_network.outStretch,
-                    input2=obj.t.get()
-                )
-                pymel.connectAttr(util_get_t.outputX, obj.tx, force=True)
-                pymel.connectAttr(util_get_t.outputY, obj.ty, force=True)
-                pymel.connectAttr(util_get_t.outputZ, obj.tz, force=True)
+                obj = stretch_chain[i].__melobject__()
+                for attr_name, value in zip(('tx', 'ty', 'tz'), cmds.getAttr(obj + '.translate')[0]):
+                    if value:
+                        stretch_plugs.append(('{0}.{1}'.format(obj, attr_name), value))
+
+        for i in range(0, len(stretch_plugs), 3):
+            lanes = zip('XYZ', stretch_plugs[i:i + 3])
+            kwargs = {}
+            for axis, (_, value) in lanes:
+                kwargs['input1' + axis] = attr_out_stretch
+                kwargs['input2' + axis] = value
+            util_get_t = libRigging.create_utility_node_fast('multiplyDivide', **kwargs)
+            for axis, (plug, _) in lanes:
+                cmds.connectAttr(util_get_t + '.output' + axis, plug, force=True)
 
         return soft_ik_network
 
@@ -426,9 +509,12 @@ class IK(Module):
 
         # Create a group for the ik system
         # This group will be parentConstrained to the module parent.
+        # Note: The build use cmds where possible, the nodes are wrapped in PyNode only when they are kept.
         ikChainGrp_name = nomenclature_rig.resolve('ikChain')
-        self._ikChainGrp = pymel.createNode('transform', name=ikChainGrp_name, parent=self.grp_rig)
-        self._ikChainGrp.setMatrix(self.chain.start.getMatrix(worldSpace=True), worldSpace=True)
+        ik_chain_grp = cmds.createNode('transform', name=ikChainGrp_name)
+        tm_start = cmds.xform(self.chain.start.__melobject__(), query=True, matrix=True, worldSpace=True)
+        cmds.xform(ik_chain_grp, matrix=tm_start, worldSpace=True)
+        self._ikChainGrp = pymel.PyNode(ik_chain_grp)
 
         super(IK, self).build(*args, **kwargs)
 
@@ -437,10 +523,8 @@ class IK(Module):
         # Duplicate input chain (we don't want to move the hierarchy)
         # self._chain_ik = pymel.duplicate(list(self.chain_jnt), renameChildren=True, parentOnly=True)
         self._chain_ik = self.chain.duplicate()
-        i = 1
-        for oIk in self._chain_ik:
-            oIk.rename(nomenclature_rig.resolve('{0:02}'.format(i)))
-            i += 1
+        for i, oIk in enumerate(self._chain_ik, 1):
+            cmds.rename(oIk.__melobject__(), nomenclature_rig.resolve('{0:02}'.format(i)))
         self._chain_ik[0].setParent(self.parent)  # Trick the IK system (temporary solution)
 
         obj_e = self._chain_ik[index_hand]
@@ -501,9 +585,11 @@ class IK(Module):
         # Create the ik_handle_target that will control the ik_handle
         # This is allow us to override what control the main ik_handle
         # Mainly used for the Leg setup
-        self._ik_handle_target = pymel.createNode('transform', name=nomenclature_rig.resolve('ikHandleTarget'))
-        self._ik_handle_target.setParent(self.grp_rig)
-        pymel.pointConstraint(self.ctrl_ik, self._ik_handle_target)
+        ctrl_ik = self.ctrl_ik.node.__melobject__()
+        ik_handle_target = cmds.createNode('transform', name=nomenclature_rig.resolve('ikHandleTarget'),
+                                           parent=self.grp_rig.__melobject__())
+        cmds.pointConstraint(ctrl_ik, ik_handle_target)
+        self._ik_handle_target = pymel.PyNode(ik_handle_target)
 
         #
         # Create softIk node and connect user accessible attributes to it.
@@ -512,9 +598,10 @@ class IK(Module):
             self.setup_softik([self._ik_handle], [self._chain_ik])
 
         # Connect global scale
-        pymel.connectAttr(self.grp_rig.globalScale, self._ikChainGrp.sx)
-        pymel.connectAttr(self.grp_rig.globalScale, self._ikChainGrp.sy)
-        pymel.connectAttr(self.grp_rig.globalScale, self._ikChainGrp.sz)
+        attr_global_scale = self.grp_rig.globalScale.__melobject__()
+        ik_chain_grp = self._ikChainGrp.__melobject__()
+        for attr_name in ('sx', 'sy', 'sz'):
+            cmds.connectAttr(attr_global_scale, '{0}.{1}'.format(ik_chain_grp, attr_name))
 
         # Setup swivel
         self.ctrl_swivel = self.setup_swivel_ctrl(self.ctrl_swivel, jnt_elbow, swivel_pos, self._ik_handle)
@@ -524,12 +611,12 @@ class IK(Module):
 
         # Connect rig -> anm
         if constraint_handle:
-            pymel.pointConstraint(self.ctrl_ik, self._ik_handle, maintainOffset=True)
-        pymel.orientConstraint(self.ctrl_ik, obj_e, maintainOffset=True)
+            cmds.pointConstraint(ctrl_ik, self._ik_handle.__melobject__(), maintainOffset=True)
+        cmds.orientConstraint(ctrl_ik, obj_e.__melobject__(), maintainOffset=True)
 
         if constraint:
             for source, target in zip(self._chain_ik, self.chain):
-                pymel.parentConstraint(source, target)
+                cmds.parentConstraint(source.__melobject__(), target.__melobject__())
 
     def unbuild(self):
         """
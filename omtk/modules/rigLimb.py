@@ -11,6 +11,7 @@ from omtk.libs import libRigging
 from omtk.libs import libCtrlShapes
 from omtk.libs import libAttr
 from omtk.libs import libPython
+from omtk.libs import libPymel
 
 
 class BaseAttHolder(BaseCtrl):
@@ -265,9 +266,11 @@ class Limb(Module):
 
         # Position swivel
         # pos_ref = self.sysFK.ctrls[self.sysIK.iCtrlIndex - 1].getTranslation(space='world')
-        pos_s = self.sysFK.ctrls[0].getTranslation(space='world')
-        pos_m = self.sysFK.ctrls[self.sysIK.iCtrlIndex - 1].getTranslation(space='world')
-        pos_e = self.sysFK.ctrls[self.sysIK.iCtrlIndex].getTranslation(space='world')
+        pos_s, pos_m, pos_e = libPymel.get_world_translations((
+            self.sysFK.ctrls[0],
+            self.sysFK.ctrls[self.sysIK.iCtrlIndex - 1],
+            self.sysFK.ctrls[self.sysIK.iCtrlIndex]
+        ))
 
         length_start = pos_m.distanceTo(pos_s)
         length_end = pos_m.distanceTo(pos_e)
@@ -1,17 +1,34 @@
-import pymel.core as pymel
+from maya import cmds
+
+
+def _get_class_tokens(net):
+    """
+    Same logic as libSerialization.is_network_from_class, without creating any PyNode.
+    :param net: The name of a network node.
+    :return: The class namespace tokens stored on the network.
+    """
+    # Previously the full namespace was stored in the '_class' attribute.
+    for attr_name in ('_class_namespace', '_class'):
+        if cmds.attributeQuery(attr_name, node=net, exists=True):
+            return (cmds.getAttr('{0}.{1}'.format(net, attr_name)) or '').split('.')
+    return ()
 
-from omtk.vendor import libSerialization
 
 def run():
-    nets = pymel.ls(type='network')
-    net_rig = next(iter(net for net in nets if libSerialization.is_network_from_class(net, 'Rig')), None)
+    # Resolve the rig and the modules networks in a single pass.
+    net_rig = None
+    nets_module = []
+    for net in cmds.ls(type='network') or []:
+        tokens = _get_class_tokens(net)
+        if net_rig is None and 'Rig' in tokens:
+            net_rig = net
+        if 'Module' in tokens:
+            nets_module.append(net)
 
-    for net in nets:
-        if not libSerialization.is_network_from_class(net, 'Module'):
-            continue
-        if not net.hasAttr('rig'):
+    for net in nets_module:
+        if not cmds.attributeQuery('rig', node=net, exists=True):
             print("Adding attribute 'rig' on {0}".format(net))
-            pymel.addAttr(net, longName='rig', niceName='rig', attributeType='message')
-        if not net.rig.isDestination():
+            cmds.addAttr(net, longName='rig', niceName='rig', attributeType='message')
+        if not cmds.listConnections(net + '.rig', source=True, destination=False):
             print("Connecting attribute 'rig' on {0}".format(net))
-            pymel.connectAttr(net_rig.message, net.rig)
+            cmds.connectAttr(net_rig + '.message', net + '.rig')
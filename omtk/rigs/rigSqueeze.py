@@ -5,7 +5,6 @@ import pymel.core as pymel
 from omtk.core import className
 from omtk.core import classRig
 from omtk.libs import libAttr
-from omtk.libs import libPymel
 
 
 class CtrlMaster(classRig.CtrlRoot):
@@ -86,6 +85,13 @@ class RigSqueeze(classRig.Rig):
     ATTR_NAME_FACE_MACRO = 'showMacroCtrls'
     ATTR_NAME_FACE_MICRO = 'showMicroCtrls'
 
+    _PYNODE_ATTRS = classRig.Rig._PYNODE_ATTRS + (
+        'grp_model',
+        'grp_proxy',
+        'grp_anm_master',
+        'grp_fx',
+    )
+
     def __init__(self, *args, **kwargs):
         super(RigSqueeze, self).__init__(*args, **kwargs)
 
@@ -128,7 +134,6 @@ class RigSqueeze(classRig.Rig):
         #
         # Create specific group related to squeeze rig convention
         #
-        all_geos = libPymel.ls_root_geos()
 
         # Build All_Grp
         self.grp_master = self.build_grp(classRig.RigGrp, self.grp_master, self.nomenclature.root_all_name)
@@ -0,0 +1,54 @@
+import math
+import mayaunittest
+import pymel.core as pymel
+from omtk.modules import rigIK
+
+
+def _get_softik_reference(distance, chain_length, ratio, stretch):
+    """
+    Evaluate the original soft-ik formulas in Python.
+    :return: A tuple containing the expected outRatio, outStretch and outRatioInv values.
+    """
+    distance_soft = chain_length * ratio
+    distance_safe = chain_length - distance_soft
+    distance_soft_clamped = min(max(distance_soft, 0.0001), 999)
+    delta_safe_soft = (distance - distance_safe) / distance_soft_clamped
+    out_distance_soft = (distance_soft * (1 - (math.e ** (delta_safe_soft * -1)))) + distance_safe
+
+    out_distance = out_distance_soft if delta_safe_soft > 0.0 else distance
+    out_distance = out_distance * (1.0 - stretch) + distance * stretch
+
+    out_stretch = distance / out_distance_soft if distance > distance_safe else 1.0
+    out_stretch = 1.0 * (1.0 - stretch) + out_stretch * stretch
+
+    out_ratio = out_distance / distance
+    return out_ratio, out_stretch, 1.0 - out_ratio
+
+
+class SoftIkTests(mayaunittest.TestCase):
+    def test_softik_network(self):
+        obj_s = pymel.createNode('transform')
+        obj_e = pymel.createNode('transform')
+
+        network = rigIK.SoftIkNode()
+        network.build(name='softik')
+        pymel.connectAttr(obj_s.worldMatrix, network.inMatrixS)
+        pymel.connectAttr(obj_e.worldMatrix, network.inMatrixE)
+
+        for distance, chain_length, ratio, stretch in (
+                (9.8, 10.0, 0.1, 0.0),
+                (9.8, 10.0, 0.1, 1.0),
+                (9.8, 10.0, 0.1, 0.3),
+                (5.0, 10.0, 0.1, 0.5),
+                (12.0, 10.0, 0.2, 0.7),
+        ):
+            obj_e.tx.set(distance)
+            network.inChainLength.set(chain_length)
+            network.inRatio.set(ratio)
+            network.inStretch.set(stretch)
+
+            out_ratio, out_stretch, out_ratio_inv = _get_softik_reference(distance, chain_length, ratio, stretch)
+            self.assertAlmostEqual(network.outRatio.get(), out_ratio, places=4)
+            self.assertAlmostEqual(network.outStretch.get(), out_stretch, places=4)
+            self.assertAlmostEqual(network.outRatioInv.get(), out_ratio_inv, places=4)
+            self.assertAlmostEqual(network.outRatio.get() + network.outRatioInv.get(), 1.0, places=4)